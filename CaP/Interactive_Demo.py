@@ -14,13 +14,13 @@ import openai
 import re
 # imports for LMPs
 import ast
-import astunparse
 from time import sleep
 from openai.error import RateLimitError, APIConnectionError
 from pygments import highlight
 from pygments.lexers import PythonLexer
 from pygments.formatters import TerminalFormatter
 
+from function_parser import FunctionParser, get_function_body
 from prompt_swarm_robot import swarm_system_prompt, task_name
 from swarm_prompt.robot_api_prompt import robot_api, GLOBAL_ROBOT_API, LOCAL_ROBOT_API
 
@@ -196,10 +196,11 @@ class LMPFGen:
             return f, f_src
         return f
 
-    def create_new_fs_from_code(self, code_str, other_vars=None, fix_bugs=False, return_src=True):
+    def create_new_fs_from_code(self, code_str, other_vars=None, fix_bugs=False, return_src=True, nodes=None):
         fs, f_assigns = {}, {}
-        f_parser = FunctionParser(fs, f_assigns)
-        f_parser.visit(ast.parse(code_str))
+        f_parser = FunctionParser(fs, f_assigns, code_str)
+        for node in nodes if nodes is not None else [ast.parse(code_str)]:
+            f_parser.visit(node)
         for f_name, f_assign in f_assigns.items():
             if f_name in fs:
                 fs[f_name] = f_assign
@@ -215,9 +216,8 @@ class LMPFGen:
                 f, f_src = self.create_f_from_sig(f_name, f_sig, new_fs, fix_bugs=fix_bugs, return_src=True)
 
                 # recursively define child_fs in the function body if needed
-                f_def_body = astunparse.unparse(ast.parse(f_src).body[0].body)
                 child_fs, child_f_srcs = self.create_new_fs_from_code(
-                    f_def_body, other_vars=all_vars, fix_bugs=fix_bugs, return_src=True
+                    f_src, other_vars=all_vars, fix_bugs=fix_bugs, return_src=True, nodes=get_function_body(f_src)
                 )
 
                 if len(child_fs) > 0:
@@ -237,30 +237,6 @@ class LMPFGen:
         return new_fs
 
 
-class FunctionParser(ast.NodeTransformer):
-
-    def __init__(self, fs, f_assigns):
-        super().__init__()
-        self._fs = fs
-        self._f_assigns = f_assigns
-
-    def visit_Call(self, node):
-        self.generic_visit(node)
-        if isinstance(node.func, ast.Name):
-            f_sig = astunparse.unparse(node).strip()
-            f_name = astunparse.unparse(node.func).strip()
-            self._fs[f_name] = f_sig
-        return node
-
-    def visit_Assign(self, node):
-        self.generic_visit(node)
-        if isinstance(node.value, ast.Call):
-            assign_str = astunparse.unparse(node).strip()
-            f_name = astunparse.unparse(node.value.func).strip()
-            self._f_assigns[f_name] = assign_str
-        return node
-
-
 def var_exists(name, all_vars):
     try:
         eval(name, all_vars)
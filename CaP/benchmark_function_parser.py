@@ -0,0 +1,81 @@
+import ast
+import glob
+import os
+import timeit
+
+from function_parser import FunctionParser
+
+try:
+    import astunparse
+
+    unparse = astunparse.unparse
+except ImportError:  # astunparse is no longer a CaP requirement
+    unparse = ast.unparse
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+example_globs = [
+    os.path.join(script_dir, "../llm2swarm/controller_examples/*.py"),
+    os.path.join(script_dir, "../workspace/CaP/*/*/main.py"),
+]
+
+
+class UnparseFunctionParser(ast.NodeTransformer):
+    """The previous parser, which unparsed every call and assignment node."""
+
+    def __init__(self, fs, f_assigns):
+        super().__init__()
+        self._fs = fs
+        self._f_assigns = f_assigns
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if isinstance(node.func, ast.Name):
+            f_sig = unparse(node).strip()
+            f_name = unparse(node.func).strip()
+            self._fs[f_name] = f_sig
+        return node
+
+    def visit_Assign(self, node):
+        self.generic_visit(node)
+        if isinstance(node.value, ast.Call):
+            assign_str = unparse(node).strip()
+            f_name = unparse(node.value.func).strip()
+            self._f_assigns[f_name] = assign_str
+        return node
+
+
+def parse_unparse(code_str, tree):
+    fs, f_assigns = {}, {}
+    UnparseFunctionParser(fs, f_assigns).visit(tree)
+    return fs, f_assigns
+
+
+def parse_ast(code_str, tree):
+    fs, f_assigns = {}, {}
+    FunctionParser(fs, f_assigns, code_str).visit(tree)
+    return fs, f_assigns
+
+
+def main(number=20):
+    paths = sorted(p for pattern in example_globs for p in glob.glob(pattern))
+    sources = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as file:
+            code_str = file.read()
+        sources.append((code_str, ast.parse(code_str)))
+    print(f"Parsing {len(sources)} example files, {number} rounds (ast.parse excluded)")
+
+    for code_str, tree in sources:
+        old_fs, _ = parse_unparse(code_str, tree)
+        new_fs, _ = parse_ast(code_str, tree)
+        assert old_fs.keys() == new_fs.keys()
+
+    old = timeit.timeit(lambda: [parse_unparse(*s) for s in sources], number=number)
+    new = timeit.timeit(lambda: [parse_ast(*s) for s in sources], number=number)
+    print(f"unparse-based parser: {old:.4f}s")
+    print(f"ast-based parser:     {new:.4f}s")
+    print(f"speedup:              {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
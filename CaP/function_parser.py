@@ -0,0 +1,105 @@
+import ast
+import io
+import tokenize
+
+
+def get_callee_name(func):
+    """Resolve the dotted name of a call target, e.g. ``np.linalg.norm``.
+
+    Returns None for callees that are not plain names/attribute chains
+    (``f()()``, ``fs[0]()``, ...), which can never be LMP-generated functions.
+    """
+    parts = []
+    while isinstance(func, ast.Attribute):
+        parts.append(func.attr)
+        func = func.value
+    if not isinstance(func, ast.Name):
+        return None
+    parts.append(func.id)
+    return '.'.join(reversed(parts))
+
+
+def get_function_body(f_src):
+    """Return the statements of the first function defined in ``f_src``."""
+    return ast.parse(f_src).body[0].body
+
+
+class SourceLines:
+    """Slice node source out of ``code_str``, splitting it into lines only once.
+
+    A node on a single line is returned as written, like
+    ``ast.get_source_segment(code_str, node)`` but without re-splitting the
+    whole source on every call. A node spanning several lines, or with runs of
+    whitespace, is normalized by ``one_line``, so that the signatures put into
+    prompts do not depend on how the code is wrapped or indented.
+    """
+
+    def __init__(self, code_str):
+        self._lines = [line.encode() for line in code_str.splitlines(keepends=True)]
+
+    def segment(self, node):
+        lines = self._lines[node.lineno - 1:node.end_lineno]
+        if len(lines) == 1:
+            text = lines[0][node.col_offset:node.end_col_offset].decode()
+            return text if '  ' not in text else one_line(text)
+        last = lines[-1][:node.end_col_offset]
+        return one_line(b''.join([lines[0][node.col_offset:], *lines[1:-1], last]).decode())
+
+
+_OPENING_BRACKETS = ('(', '[', '{')
+_CLOSING_TOKENS = (')', ']', '}', ',')
+_LAYOUT_TOKENS = (tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT, tokenize.INDENT, tokenize.DEDENT,
+                  tokenize.ENDMARKER)
+
+
+def one_line(src):
+    """Join the tokens of ``src`` onto one line with single spaces.
+
+    Line breaks, continuation backslashes and comments are dropped, no space is
+    kept after an opening bracket or before a closing bracket or comma, and
+    string literals are left as they are, e.g. ``'foo(\\n    a,  # x\\n    b)'``
+    becomes ``'foo(a, b)'``.
+    """
+    parts = []
+    prev = None
+    for tok in tokenize.generate_tokens(io.StringIO(src).readline):
+        if tok.type in _LAYOUT_TOKENS:
+            continue
+        if prev is not None:
+            if tok.start[0] != prev.end[0]:
+                gap = prev.string not in _OPENING_BRACKETS and tok.string not in _CLOSING_TOKENS
+            else:
+                gap = tok.start[1] > prev.end[1]
+            if gap:
+                parts.append(' ')
+        parts.append(tok.string)
+        prev = tok
+    return ''.join(parts)
+
+
+class FunctionParser(ast.NodeVisitor):
+    """Collect undefined-function candidates from generated code in a single pass.
+
+    ``fs`` maps every called plain name to its call signature and ``f_assigns``
+    maps every callee of an assignment to the assignment statement. Names and
+    signatures are read straight from the AST nodes and the original source,
+    so no node is ever unparsed.
+    """
+
+    def __init__(self, fs, f_assigns, code_str):
+        super().__init__()
+        self._fs = fs
+        self._f_assigns = f_assigns
+        self._source = SourceLines(code_str)
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if isinstance(node.func, ast.Name):
+            self._fs[node.func.id] = self._source.segment(node)
+
+    def visit_Assign(self, node):
+        self.generic_visit(node)
+        if isinstance(node.value, ast.Call):
+            f_name = get_callee_name(node.value.func)
+            if f_name is not None:
+                self._f_assigns[f_name] = self._source.segment(node)
@@ -39,9 +39,7 @@ class Action(SerializationMixin, ContextMixin, BaseModel):
 
     @property
     def repo(self) -> ProjectRepo:
-        if not self.context.repo:
-            self.context.repo = ProjectRepo(self.context.git_repo)
-        return self.context.repo
+        return self.context.project_repo()
 
     @property
     def prompt_schema(self):
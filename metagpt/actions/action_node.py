@@ -8,10 +8,11 @@
 NOTE: You should use typing.List instead of list to do type annotation. Because in the markdown extraction process,
   we can use typing to extract the type of the node, but we cannot use built-in list to extract.
 """
+import asyncio
 import json
 import typing
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel, Field, create_model, model_validator
 from tenacity import retry, stop_after_attempt, wait_random_exponential
@@ -19,8 +20,9 @@ from tenacity import retry, stop_after_attempt, wait_random_exponential
 from metagpt.actions.action_outcls_registry import register_action_outcls
 from metagpt.const import USE_CONFIG_TIMEOUT
 from metagpt.llm import BaseLLM
-from metagpt.logs import logger
+from metagpt.logs import capture_llm_stream, logger
 from metagpt.provider.postprocess.llm_output_postprocess import llm_output_postprocess
+from metagpt.provider.postprocess.stream_json_parser import StreamJsonParser
 from metagpt.utils.common import OutputParser, general_after_log
 from metagpt.utils.human_interaction import HumanInteraction
 
@@ -41,12 +43,9 @@ TAG = "CONTENT"
 LANGUAGE_CONSTRAINT = "Language: Please use the same language as Human INPUT."
 FORMAT_CONSTRAINT = f"Format: output wrapped inside [{TAG}][/{TAG}] like format example, nothing else."
 
+# The static part, i.e. the format example, nodes and constraint, comes first and the per-call context after it,
+# so that the prompts of an ActionNode share a stable prefix that providers can cache.
 SIMPLE_TEMPLATE = """
-## context
-{context}
-
------
-
 ## format example
 {example}
 
@@ -56,6 +55,11 @@ SIMPLE_TEMPLATE = """
 ## constraint
 {constraint}
 
+-----
+
+## context
+{context}
+
 ## action
 Follow instructions of nodes, generate output and make sure it follows the format example.
 """
@@ -166,6 +170,7 @@ class ActionNode:
         self.schema = schema
         self.prevs = []
         self.nexts = []
+        self._compiled = {}  # (schema, mode, exclude) -> (tree fingerprint, instruction, example), see `compile`
 
     def __str__(self):
         return (
@@ -360,6 +365,13 @@ class ActionNode:
         format_func = lambda i: i.example
         return self._compile_f(schema, mode, tag, format_func, kv_sep="\n", exclude=exclude)
 
+    def _fingerprint(self) -> tuple:
+        """Everything `compile_instruction` and `compile_example` read from the node tree, the example is snapshot as
+        text, so that a list or dict example changed in place is noticed"""
+        children = tuple(i._fingerprint() for i in self.children.values())
+        example = json.dumps(self.example, sort_keys=True, ensure_ascii=False, default=str)
+        return self.key, self.expected_type, self.instruction, example, children
+
     def compile(self, context, schema="json", mode="children", template=SIMPLE_TEMPLATE, exclude=[]) -> str:
         """
         mode: all/root/children
@@ -387,8 +399,17 @@ class ActionNode:
 
         # FIXME: json instruction会带来格式问题，如："Project name": "web_2048  # 项目名称使用下划线",
         # compile example暂时不支持markdown
-        instruction = self.compile_instruction(schema="markdown", mode=mode, exclude=exclude)
-        example = self.compile_example(schema=schema, tag=TAG, mode=mode, exclude=exclude)
+        # The instruction and example only depend on the node tree, so they are compiled once per schema/mode/exclude
+        # and recompiled only when a node of the tree has changed since.
+        cache_key = (schema, mode, tuple(exclude or ()))
+        fingerprint = self._fingerprint()
+        cached = self._compiled.get(cache_key)
+        if cached and cached[0] == fingerprint:
+            _, instruction, example = cached
+        else:
+            instruction = self.compile_instruction(schema="markdown", mode=mode, exclude=exclude)
+            example = self.compile_example(schema=schema, tag=TAG, mode=mode, exclude=exclude)
+            self._compiled[cache_key] = (fingerprint, instruction, example)
         # nodes = ", ".join(self.to_dict(mode=mode).keys())
         constraints = [LANGUAGE_CONSTRAINT, FORMAT_CONSTRAINT]
         constraint = "\n".join(constraints)
@@ -415,9 +436,26 @@ class ActionNode:
         system_msgs: Optional[list[str]] = None,
         schema="markdown",  # compatible to original format
         timeout=USE_CONFIG_TIMEOUT,
+        field_callback: Optional[Callable[[str, Any], None]] = None,
     ) -> (str, BaseModel):
         """Use ActionOutput to wrap the output of aask"""
-        content = await self.llm.aask(prompt, system_msgs, images=images, timeout=timeout)
+        if field_callback and schema == "json":
+            # Stream the output and report each field once its value is closed, a retry reports the fields again.
+            parser = StreamJsonParser()
+            chunks = []
+
+            def _on_chunk(chunk: str):
+                chunks.append(chunk)
+                for key, value in parser.feed(chunk):
+                    field_callback(key, value)
+
+            with capture_llm_stream(_on_chunk):
+                content = await self.llm.aask(prompt, system_msgs, images=images, timeout=timeout, stream=True)
+            if not chunks:
+                logger.warning(f"{type(self.llm).__name__} did not stream its output, report the fields at its end")
+                _on_chunk(content)
+        else:
+            content = await self.llm.aask(prompt, system_msgs, images=images, timeout=timeout)
         logger.debug(f"llm raw output:\n{content}")
         output_class = self.create_model_class(output_class_name, output_data_mapping)
 
@@ -447,7 +485,13 @@ class ActionNode:
         self.set_recursive("context", context)
 
     async def simple_fill(
-        self, schema, mode, images: Optional[Union[str, list[str]]] = None, timeout=USE_CONFIG_TIMEOUT, exclude=None
+        self,
+        schema,
+        mode,
+        images: Optional[Union[str, list[str]]] = None,
+        timeout=USE_CONFIG_TIMEOUT,
+        exclude=None,
+        field_callback: Optional[Callable[[str, Any], None]] = None,
     ):
         prompt = self.compile(context=self.context, schema=schema, mode=mode, exclude=exclude)
 
@@ -455,7 +499,13 @@ class ActionNode:
             mapping = self.get_mapping(mode, exclude=exclude)
             class_name = f"{self.key}_AN"
             content, scontent = await self._aask_v1(
-                prompt, class_name, mapping, images=images, schema=schema, timeout=timeout
+                prompt,
+                class_name,
+                mapping,
+                images=images,
+                schema=schema,
+                timeout=timeout,
+                field_callback=field_callback,
             )
             self.content = content
             self.instruct_content = scontent
@@ -475,6 +525,8 @@ class ActionNode:
         images: Optional[Union[str, list[str]]] = None,
         timeout=USE_CONFIG_TIMEOUT,
         exclude=[],
+        max_concurrency: int = 5,
+        field_callback: Optional[Callable[[str, Any], None]] = None,
     ):
         """Fill the node(s) with mode.
 
@@ -494,24 +546,43 @@ class ActionNode:
         :param images: the list of image url or base64 for gpt4-v
         :param timeout: Timeout for llm invocation.
         :param exclude: The keys of ActionNode to exclude.
+        :param max_concurrency: The maximum number of children filled at the same time with the complex strategy.
+        :param field_callback: Called with `(key, value)` as soon as a field of the json output is streamed, or once
+            the output is complete if the LLM does not stream it. Only supported with the json schema.
         :return: self
         """
         self.set_llm(llm)
         self.set_context(context)
         if self.schema:
             schema = self.schema
+        if field_callback and schema != "json":
+            raise ValueError(f"field_callback is only supported with the json schema, not {schema}")
 
         if strgy == "simple":
-            return await self.simple_fill(schema=schema, mode=mode, images=images, timeout=timeout, exclude=exclude)
+            return await self.simple_fill(
+                schema=schema, mode=mode, images=images, timeout=timeout, exclude=exclude, field_callback=field_callback
+            )
         elif strgy == "complex":
             # 这里隐式假设了拥有children
+            # The children are independent fields filled from the same context, so fill them concurrently.
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _fill_child(child: ActionNode) -> ActionNode:
+                async with semaphore:
+                    return await child.simple_fill(
+                        schema=schema,
+                        mode=mode,
+                        images=images,
+                        timeout=timeout,
+                        exclude=exclude,
+                        field_callback=field_callback,
+                    )
+
+            children = [i for i in self.children.values() if not (exclude and i.key in exclude)]
             tmp = {}
-            for _, i in self.children.items():
-                if exclude and i.key in exclude:
-                    continue
-                child = await i.simple_fill(schema=schema, mode=mode, images=images, timeout=timeout, exclude=exclude)
+            for child in await asyncio.gather(*[_fill_child(i) for i in children]):
                 tmp.update(child.instruct_content.model_dump())
-            cls = self._create_children_class()
+            cls = self._create_children_class(exclude=exclude)
             self.instruct_content = cls(**tmp)
             return self
 
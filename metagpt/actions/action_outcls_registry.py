@@ -3,9 +3,14 @@
 # @Desc   : registry to store Dynamic Model from ActionNode.create_model_class to keep it as same Class
 #           with same class name and mapping
 
+from collections import OrderedDict
 from functools import wraps
 
-action_outcls_registry = dict()
+# Most recently used classes are kept, so that the registry does not grow without bound when class names or
+# mappings are generated at runtime. Instances of an evicted class no longer compare equal to those of its successor.
+ACTION_OUTCLS_REGISTRY_MAXSIZE = 1024
+
+action_outcls_registry = OrderedDict()
 
 
 def register_action_outcls(func):
@@ -33,10 +38,13 @@ def register_action_outcls(func):
         outcls_id = outcls_id.replace("typing.List", "list").replace("typing.Dict", "dict")
 
         if outcls_id in action_outcls_registry:
+            action_outcls_registry.move_to_end(outcls_id)
             return action_outcls_registry[outcls_id]
 
         out_cls = func(*args, **kwargs)
         action_outcls_registry[outcls_id] = out_cls
+        if len(action_outcls_registry) > ACTION_OUTCLS_REGISTRY_MAXSIZE:
+            action_outcls_registry.popitem(last=False)
         return out_cls
 
     return decorater
@@ -38,9 +38,10 @@ class ExecuteNbCode(Action):
 
     def __init__(
         self,
-        nb=nbformat.v4.new_notebook(),
+        nb=None,
         timeout=600,
     ):
+        nb = nb or nbformat.v4.new_notebook()  # a notebook per instance, so that kernels can run side by side
         super().__init__(
             nb=nb,
             nb_client=NotebookClient(nb, timeout=timeout),
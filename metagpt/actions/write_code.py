@@ -14,8 +14,12 @@
         3. Encapsulate the input of RunCode into RunCodeContext and encapsulate the output of RunCode into
         RunCodeResult to standardize and unify parameter passing between WriteCode, RunCode, and DebugError.
 """
+from __future__ import annotations
 
 import json
+import stat
+from pathlib import Path
+from typing import Optional
 
 from pydantic import Field
 from tenacity import retry, stop_after_attempt, wait_random_exponential
@@ -26,7 +30,8 @@ from metagpt.actions.write_code_plan_and_change_an import REFINED_TEMPLATE
 from metagpt.const import BUGFIX_FILENAME, REQUIREMENT_FILENAME
 from metagpt.logs import logger
 from metagpt.schema import CodingContext, Document, RunCodeResult
-from metagpt.utils.common import CodeParser
+from metagpt.utils.common import CodeParser, aread
+from metagpt.utils.file_repository import FileRepository
 from metagpt.utils.project_repo import ProjectRepo
 
 PROMPT_TEMPLATE = """
@@ -80,9 +85,41 @@ ATTENTION: Use '##' to SPLIT SECTIONS, not '#'. Output format carefully referenc
 """
 
 
+class CodeContext:
+    """The source files read for writing the code of a run, cached by path, modification time and size.
+
+    A file is read again only once it changes on disk, and `update` records the file just written without reading it
+    back, so writing a file costs no more disk reads however many files the run has written before.
+    """
+
+    def __init__(self):
+        self._files = {}  # path -> ((mtime, size), content)
+
+    async def get(self, file_repo: FileRepository, filename: Path | str) -> Document | None:
+        pathname = file_repo.workdir / filename
+        try:
+            st = pathname.stat()
+        except FileNotFoundError:
+            self._files.pop(str(pathname), None)
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        cached = self._files.get(str(pathname))
+        if not cached or cached[0] != (st.st_mtime_ns, st.st_size):
+            cached = ((st.st_mtime_ns, st.st_size), await aread(pathname))
+            self._files[str(pathname)] = cached
+        return Document(root_path=str(file_repo.root_path), filename=str(filename), content=cached[1])
+
+    def update(self, file_repo: FileRepository, filename: Path | str, content: str):
+        pathname = file_repo.workdir / filename
+        st = pathname.stat()
+        self._files[str(pathname)] = ((st.st_mtime_ns, st.st_size), content)
+
+
 class WriteCode(Action):
     name: str = "WriteCode"
     i_context: Document = Field(default_factory=Document)
+    code_context: Optional[CodeContext] = Field(default=None, exclude=True)
 
     @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
     async def write_code(self, prompt) -> str:
@@ -107,13 +144,18 @@ class WriteCode(Action):
             code_context = coding_context.code_doc.content
         elif self.config.inc:
             code_context = await self.get_codes(
-                coding_context.task_doc, exclude=self.i_context.filename, project_repo=self.repo, use_inc=True
+                coding_context.task_doc,
+                exclude=self.i_context.filename,
+                project_repo=self.repo,
+                use_inc=True,
+                code_context=self.code_context,
             )
         else:
             code_context = await self.get_codes(
                 coding_context.task_doc,
                 exclude=self.i_context.filename,
                 project_repo=self.repo.with_src_path(self.context.src_workspace),
+                code_context=self.code_context,
             )
 
         if self.config.inc:
@@ -148,7 +190,13 @@ class WriteCode(Action):
         return coding_context
 
     @staticmethod
-    async def get_codes(task_doc: Document, exclude: str, project_repo: ProjectRepo, use_inc: bool = False) -> str:
+    async def get_codes(
+        task_doc: Document,
+        exclude: str,
+        project_repo: ProjectRepo,
+        use_inc: bool = False,
+        code_context: CodeContext = None,
+    ) -> str:
         """
         Get codes for generating the exclude file in various scenarios.
 
@@ -157,6 +205,7 @@ class WriteCode(Action):
             exclude (str): The file to be generated. Specifies the filename to be excluded from the code snippets.
             project_repo (ProjectRepo): ProjectRepo object of the project.
             use_inc (bool): Indicates whether the scenario involves incremental development. Defaults to False.
+            code_context (CodeContext): The source files cached for the run, the files are read if not given.
 
         Returns:
             str: Codes for generating the exclude file.
@@ -164,7 +213,8 @@ class WriteCode(Action):
         if not task_doc:
             return ""
         if not task_doc.content:
-            task_doc = project_repo.docs.task.get(filename=task_doc.filename)
+            task_doc = await project_repo.docs.task.get(filename=task_doc.filename)
+        code_context = code_context or CodeContext()
         m = json.loads(task_doc.content)
         code_filenames = m.get(TASK_LIST.key, []) if not use_inc else m.get(REFINED_TASK_LIST.key, [])
         codes = []
@@ -186,14 +236,14 @@ class WriteCode(Action):
                     # essential functionality is included for the project’s requirements
                     if filename in old_files and filename != "main.py":
                         # Use old code
-                        doc = await old_file_repo.get(filename=filename)
+                        doc = await code_context.get(old_file_repo, filename)
                     # If the file is in the src workspace, skip it
                     else:
                         continue
                     codes.insert(0, f"-----Now, {filename} to be rewritten\n```{doc.content}```\n=====")
                 # The code snippets are generated from the src workspace
                 else:
-                    doc = await src_file_repo.get(filename=filename)
+                    doc = await code_context.get(src_file_repo, filename)
                     # If the file does not exist in the src workspace, skip it
                     if not doc:
                         continue
@@ -205,7 +255,7 @@ class WriteCode(Action):
                 # Exclude the current file to get the code snippets for generating the current file
                 if filename == exclude:
                     continue
-                doc = await src_file_repo.get(filename=filename)
+                doc = await code_context.get(src_file_repo, filename)
                 if not doc:
                     continue
                 codes.append(f"----- {filename}\n```{doc.content}```")
@@ -5,11 +5,12 @@
 @Author  : alexanderwu
 @File    : context.py
 """
+import copy
 import os
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from metagpt.config2 import Config
 from metagpt.configs.llm_config import LLMConfig, LLMType
@@ -24,6 +25,9 @@ from metagpt.utils.git_repository import GitRepository
 from metagpt.utils.project_repo import ProjectRepo
 
 
+_llm_prototypes: dict[str, BaseLLM] = {}  # config fingerprint -> LLM, see `Context._create_llm`
+
+
 class AttrDict(BaseModel):
     """A dict-like object that allows access to keys as attributes, compatible with Pydantic."""
 
@@ -70,6 +74,7 @@ class Context(BaseModel):
     cost_manager: CostManager = CostManager()
 
     _llm: Optional[BaseLLM] = None
+    _cost_managers: dict[str, CostManager] = PrivateAttr(default_factory=dict)  # see `_create_llm`
 
     def new_environ(self):
         """Return a new os.environ object"""
@@ -84,6 +89,12 @@ class Context(BaseModel):
     #     self._llm = None
     #     return self._llm
 
+    def project_repo(self) -> ProjectRepo:
+        """Return the `ProjectRepo` of `git_repo`, kept in `repo` and only rebuilt when `git_repo` is replaced"""
+        if self.repo is None or self.repo.git_repo is not self.git_repo:
+            self.repo = ProjectRepo(self.git_repo)
+        return self.repo
+
     def _select_costmanager(self, llm_config: LLMConfig) -> CostManager:
         """Return a CostManager instance"""
         if llm_config.api_type == LLMType.FIREWORKS:
@@ -93,18 +104,34 @@ class Context(BaseModel):
         else:
             return self.cost_manager
 
+    def _create_llm(self, llm_config: LLMConfig) -> BaseLLM:
+        """Return a new LLM instance that shares its API client with every LLM created for the same config.
+
+        Providers build their API client (e.g. `AsyncOpenAI` with its httpx connection pool and SSL context) in
+        `__init__`, so one instance per config fingerprint is kept as a prototype and shallow-copied: the copies
+        reuse its client and connections, while attributes set per role or action, such as `system_prompt`, stay
+        per instance. Cost managers are shared per context and config: a provider that builds its own cost manager
+        (e.g. Ollama's `TokenCostManager`) gets a fresh copy of the prototype's one for each context.
+        """
+        key = llm_config.model_dump_json()
+        prototype = _llm_prototypes.get(key)
+        if prototype is None:
+            prototype = _llm_prototypes[key] = create_llm_instance(llm_config)
+        llm = copy.copy(prototype)
+        llm.config = llm_config
+        if key not in self._cost_managers:
+            if prototype.cost_manager is None:
+                self._cost_managers[key] = self._select_costmanager(llm_config)
+            else:
+                self._cost_managers[key] = prototype.cost_manager.model_copy(deep=True)
+        llm.cost_manager = self._cost_managers[key]
+        return llm
+
     def llm(self) -> BaseLLM:
-        """Return a LLM instance, fixme: support cache"""
-        # if self._llm is None:
-        self._llm = create_llm_instance(self.config.llm)
-        if self._llm.cost_manager is None:
-            self._llm.cost_manager = self._select_costmanager(self.config.llm)
+        """Return a LLM instance"""
+        self._llm = self._create_llm(self.config.llm)
         return self._llm
 
     def llm_with_cost_manager_from_llm_config(self, llm_config: LLMConfig) -> BaseLLM:
-        """Return a LLM instance, fixme: support cache"""
-        # if self._llm is None:
-        llm = create_llm_instance(llm_config)
-        if llm.cost_manager is None:
-            llm.cost_manager = self._select_costmanager(llm_config)
-        return llm
+        """Return a LLM instance"""
+        return self._create_llm(llm_config)
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set, Union
 
 from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, model_validator
 
+from metagpt.const import MESSAGE_ROUTE_TO_ALL
 from metagpt.context import Context
 from metagpt.environment.api.env_api import (
     EnvAPIAbstract,
@@ -15,8 +16,8 @@ from metagpt.environment.api.env_api import (
     WriteAPIRegistry,
 )
 from metagpt.logs import logger
-from metagpt.schema import Message
-from metagpt.utils.common import get_function_schema, is_coroutine_func, is_send_to
+from metagpt.schema import Message, MessageHistory
+from metagpt.utils.common import get_function_schema, is_coroutine_func
 
 if TYPE_CHECKING:
     from metagpt.roles.role import Role  # noqa: F401
@@ -105,7 +106,9 @@ class Environment(ExtEnv):
     desc: str = Field(default="")  # 环境描述
     roles: dict[str, SerializeAsAny["Role"]] = Field(default_factory=dict, validate_default=True)
     member_addrs: Dict["Role", Set] = Field(default_factory=dict, exclude=True)
-    history: str = ""  # For debug
+    addr_members: Dict[str, Set["Role"]] = Field(default_factory=dict, exclude=True)  # address -> roles index
+    ready_roles: Set["Role"] = Field(default_factory=set, exclude=True)  # roles with something to observe
+    history: MessageHistory = Field(default_factory=MessageHistory)  # For debug
     context: Context = Field(default_factory=Context, exclude=True)
 
     @model_validator(mode="after")
@@ -120,6 +123,8 @@ class Environment(ExtEnv):
         self.roles[role.profile] = role
         role.set_env(self)
         role.context = self.context
+        if not role.is_idle or role.recovered:
+            self.notify_ready(role)
 
     def add_roles(self, roles: Iterable["Role"]):
         """增加一批在当前环境的角色
@@ -131,6 +136,8 @@ class Environment(ExtEnv):
         for role in roles:  # setup system message with roles
             role.context = self.context
             role.set_env(self)
+            if not role.is_idle or role.recovered:
+                self.notify_ready(role)
 
     def publish_message(self, message: Message, peekable: bool = True) -> bool:
         """
@@ -142,15 +149,18 @@ class Environment(ExtEnv):
         in RFC 113.
         """
         logger.debug(f"publish_message: {message.dump()}")
-        found = False
         # According to the routing feature plan in Chapter 2.2.3.2 of RFC 113
-        for role, addrs in self.member_addrs.items():
-            if is_send_to(message, addrs):
-                role.put_message(message)
-                found = True
-        if not found:
+        if MESSAGE_ROUTE_TO_ALL in message.send_to:
+            recipients = list(self.member_addrs)
+        else:
+            recipients = set()
+            for addr in message.send_to:
+                recipients.update(self.addr_members.get(addr, ()))
+        for role in recipients:
+            role.put_message(message)
+        if not recipients:
             logger.warning(f"Message no recipients: {message.dump()}")
-        self.history += f"\n{message}"  # For debug
+        self.history.add(message)  # For debug
 
         return True
 
@@ -159,12 +169,17 @@ class Environment(ExtEnv):
         Process all Role runs at once
         """
         for _ in range(k):
+            # Only roles that were handed a message (or still hold unprocessed news) since their last run are
+            # scheduled; messages published during this round mark their recipients for the next one.
+            ready, self.ready_roles = self.ready_roles, set()
+            roles = [role for role in self.roles.values() if role in ready]
             futures = []
-            for role in self.roles.values():
+            for role in roles:
                 future = role.run()
                 futures.append(future)
 
             await asyncio.gather(*futures)
+            self.ready_roles.update(role for role in roles if not role.is_idle)
             logger.debug(f"is idle: {self.is_idle}")
 
     def get_roles(self) -> dict[str, "Role"]:
@@ -182,13 +197,14 @@ class Environment(ExtEnv):
     def role_names(self) -> list[str]:
         return [i.name for i in self.roles.values()]
 
+    def notify_ready(self, role: "Role"):
+        """Mark the role as having new messages to observe, so that it is scheduled in the next `run`."""
+        self.ready_roles.add(role)
+
     @property
     def is_idle(self):
         """If true, all actions have been executed."""
-        for r in self.roles.values():
-            if not r.is_idle:
-                return False
-        return True
+        return not self.ready_roles
 
     def get_addresses(self, obj):
         """Get the addresses of the object."""
@@ -196,9 +212,18 @@ class Environment(ExtEnv):
 
     def set_addresses(self, obj, addresses):
         """Set the addresses of the object"""
+        for addr in self.member_addrs.get(obj, ()):
+            members = self.addr_members.get(addr)
+            if members:
+                members.discard(obj)
+                if not members:
+                    del self.addr_members[addr]
         self.member_addrs[obj] = addresses
+        for addr in addresses:
+            self.addr_members.setdefault(addr, set()).add(obj)
 
     def archive(self, auto_archive=True):
+        self.history.close()
         if auto_archive and self.context.git_repo:
             self.context.git_repo.archive()
 
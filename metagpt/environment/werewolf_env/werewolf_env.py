@@ -21,7 +21,9 @@ class WerewolfEnv(Environment, WerewolfExtEnv):
             # Therefore, a unique timestamp prefix needs to be added so that the same message will not be automatically deduplicated when added to the memory.
             message.content = f"{self.timestamp} | " + message.content
         self.memory.add(message)
-        self.history += f"\n{message}"
+        self.history.add(message)
+        for role in self.roles.values():  # every role observes the shared memory
+            self.notify_ready(role)
 
     async def run(self, k=1):
         """Process all Role runs by order"""
@@ -7,8 +7,11 @@
 """
 
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from functools import partial
+from typing import Callable, Optional
 
 from loguru import logger as _logger
 
@@ -31,12 +34,26 @@ logger = define_log_level()
 
 
 def log_llm_stream(msg):
+    handler = _llm_stream_handler.get()
+    if handler:
+        handler(msg)
     _llm_stream_log(msg)
 
 
+@contextmanager
+def capture_llm_stream(handler: Callable[[str], None]):
+    """Also pass the chunks streamed by the LLM calls inside the block to `handler`, scoped to the current task."""
+    token = _llm_stream_handler.set(handler)
+    try:
+        yield
+    finally:
+        _llm_stream_handler.reset(token)
+
+
 def set_llm_stream_logfunc(func):
     global _llm_stream_log
     _llm_stream_log = func
 
 
 _llm_stream_log = partial(print, end="")
+_llm_stream_handler: ContextVar[Optional[Callable[[str], None]]] = ContextVar("llm_stream_handler", default=None)
@@ -7,9 +7,18 @@
 @Modified By: mashenquan, 2023-11-1. According to RFC 116: Updated the type of index key.
 """
 from collections import defaultdict
-from typing import DefaultDict, Iterable, Set
-
-from pydantic import BaseModel, Field, SerializeAsAny
+from typing import Any, DefaultDict, Iterable, Set
+
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    SerializeAsAny,
+    ValidationInfo,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 
 from metagpt.const import IGNORED_MESSAGE_ID
 from metagpt.schema import Message
@@ -23,12 +32,60 @@ class Memory(BaseModel):
     index: DefaultDict[str, list[SerializeAsAny[Message]]] = Field(default_factory=lambda: defaultdict(list))
     ignore_id: bool = False
 
+    _positions: dict[str, int] = PrivateAttr(default_factory=dict)  # message.id -> position in storage
+
+    @field_validator("index", mode="before")
+    @classmethod
+    def check_index(cls, index: Any, info: ValidationInfo) -> Any:
+        """Resolve the message ids written by `ser_index` to the messages in storage."""
+        storage = info.data.get("storage", [])
+        messages = {m.id: m for m in storage}
+        if len(messages) != len(storage):
+            # Ids are not unique (e.g. `ignore_id`), so rebuild the index from storage instead.
+            index = defaultdict(list)
+            for message in storage:
+                if message.cause_by:
+                    index[message.cause_by].append(message)
+            return index
+
+        def _resolve(item):
+            if isinstance(item, str):
+                return messages[item]
+            if isinstance(item, dict) and item.get("id") in messages:
+                return messages[item["id"]]  # older checkpoints hold a full copy of each message
+            return item
+
+        return {cause_by: [_resolve(i) for i in items] for cause_by, items in (index or {}).items()}
+
+    @field_serializer("index", mode="plain")
+    def ser_index(self, index: DefaultDict[str, list[Message]]) -> dict[str, list[str]]:
+        # Every indexed message is also in storage, so only reference it by id.
+        return {cause_by: [m.id for m in messages] for cause_by, messages in index.items()}
+
+    @model_validator(mode="after")
+    def check_positions(self) -> "Memory":
+        self._reindex()
+        return self
+
+    def _reindex(self, start: int = 0):
+        """Rebuild the id -> position map for storage[start:]"""
+        for i in range(start, len(self.storage)):
+            self._positions[self.storage[i].id] = i
+
+    def contains(self, message: Message) -> bool:
+        """Return whether the message is already in storage"""
+        if self.ignore_id:
+            # All ids are equal, so fall back to comparing the messages themselves.
+            return message in self.storage
+        return message.id in self._positions
+
     def add(self, message: Message):
         """Add a new message to storage, while updating the index"""
         if self.ignore_id:
             message.id = IGNORED_MESSAGE_ID
-        if message in self.storage:
+        if self.contains(message):
             return
+        self._positions[message.id] = len(self.storage)
         self.storage.append(message)
         if message.cause_by:
             self.index[message.cause_by].append(message)
@@ -49,6 +106,8 @@ class Memory(BaseModel):
         """delete the newest message from the storage"""
         if len(self.storage) > 0:
             newest_msg = self.storage.pop()
+            if self._positions.get(newest_msg.id) == len(self.storage):
+                del self._positions[newest_msg.id]
             if newest_msg.cause_by and newest_msg in self.index[newest_msg.cause_by]:
                 self.index[newest_msg.cause_by].remove(newest_msg)
         else:
@@ -59,7 +118,15 @@ class Memory(BaseModel):
         """Delete the specified message from storage, while updating the index"""
         if self.ignore_id:
             message.id = IGNORED_MESSAGE_ID
-        self.storage.remove(message)
+            self.storage.remove(message)
+            self._positions.clear()
+            self._reindex()
+        else:
+            if message.id not in self._positions:
+                raise ValueError(f"{message} not in memory")
+            pos = self._positions.pop(message.id)
+            del self.storage[pos]
+            self._reindex(start=pos)
         if message.cause_by and message in self.index[message.cause_by]:
             self.index[message.cause_by].remove(message)
 
@@ -67,6 +134,7 @@ class Memory(BaseModel):
         """Clear storage and index"""
         self.storage = []
         self.index = defaultdict(list)
+        self._positions.clear()
 
     def count(self) -> int:
         """Return the number of messages in storage"""
@@ -82,13 +150,14 @@ class Memory(BaseModel):
 
     def find_news(self, observed: list[Message], k=0) -> list[Message]:
         """find news (previously unseen messages) from the the most recent k memories, from all memories when k=0"""
-        already_observed = self.get(k)
-        news: list[Message] = []
-        for i in observed:
-            if i in already_observed:
-                continue
-            news.append(i)
-        return news
+        if self.ignore_id:
+            already_observed = self.get(k)
+            return [i for i in observed if i not in already_observed]
+        if k:
+            observed_ids = {i.id for i in self.get(k)}
+        else:
+            observed_ids = self._positions
+        return [i for i in observed if i.id not in observed_ids]
 
     def get_by_action(self, action) -> list[Message]:
         """Return all messages triggered by a specified Action"""
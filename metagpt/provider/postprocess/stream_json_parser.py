@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @Desc   : incremental parser emitting the top-level fields of a streamed JSON object as soon as they are complete
+
+from typing import Any
+
+from metagpt.utils.custom_decoder import CustomDecoder
+
+
+class StreamJsonParser:
+    """Feed the chunks of a streamed LLM output, get each top-level `key: value` pair of its JSON object back as soon
+    as the value is closed, without waiting for the rest of the output.
+
+    Text before the first `{` (e.g. `[CONTENT]` or a code fence) is skipped. Values are decoded with the tolerant
+    `CustomDecoder`, a value that still can not be decoded is returned as its raw text. The parser only looks at the
+    first object, everything after it is ignored. It is meant for early notifications; the complete output should
+    still go through `llm_output_postprocess`.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0  # next char of `_buf` to scan
+        self._depth = 0  # nesting level of `[`/`{`, the top-level object is 1
+        self._quote = ""  # the quote char of the string being scanned, "" when not in a string
+        self._escaped = False
+        self._key = None  # key of the value being scanned
+        self._start = -1  # start of the key or value being scanned in `_buf`
+        self._done = False
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """Scan the new chunk, return the fields completed by it in output order."""
+        fields = []
+        self._buf += chunk
+        buf = self._buf
+        while self._pos < len(buf) and not self._done:
+            char = buf[self._pos]
+            if self._depth == 0:
+                if char == "{":  # skip the text before the object
+                    self._depth = 1
+            elif self._quote:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == self._quote:
+                    self._quote = ""
+                    if self._depth == 1 and self._key is None:  # end of a top-level key
+                        self._key = self._decode(buf[self._start : self._pos + 1])
+                        self._start = -1
+            elif char in "\"'":
+                self._quote = char
+                if self._depth == 1 and self._start < 0:
+                    self._start = self._pos
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 2 and self._key is not None and self._start < 0:
+                    self._start = self._pos
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+                    fields.extend(self._pop_field(self._pos))
+            elif self._depth == 1:
+                if char == ",":
+                    fields.extend(self._pop_field(self._pos))
+                elif char == ":":
+                    self._start = -1  # the value starts with its first non-blank char
+                elif self._key is not None and self._start < 0 and not char.isspace():
+                    self._start = self._pos
+            self._pos += 1
+        return fields
+
+    def _pop_field(self, end: int) -> list[tuple[str, Any]]:
+        if self._key is None or self._start < 0:
+            return []
+        field = (self._key, self._decode(self._buf[self._start : end].strip()))
+        self._key = None
+        self._start = -1
+        return [field]
+
+    @staticmethod
+    def _decode(text: str) -> Any:
+        try:
+            return CustomDecoder(strict=False).decode(text)
+        except ValueError:
+            return text
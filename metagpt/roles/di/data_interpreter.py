@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Literal, Union
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 
 from metagpt.actions.di.ask_review import ReviewConst
 from metagpt.actions.di.execute_nb_code import ExecuteNbCode
@@ -11,7 +12,7 @@ from metagpt.actions.di.write_analysis_code import CheckData, WriteAnalysisCode
 from metagpt.logs import logger
 from metagpt.prompts.di.write_analysis_code import DATA_INFO
 from metagpt.roles import Role
-from metagpt.schema import Message, Task, TaskResult
+from metagpt.schema import Message, Plan, Task, TaskResult
 from metagpt.strategy.task_type import TaskType
 from metagpt.tools.tool_recommend import BM25ToolRecommender, ToolRecommender
 from metagpt.utils.common import CodeParser
@@ -43,6 +44,8 @@ class DataInterpreter(Role):
     tool_recommender: ToolRecommender = None
     react_mode: Literal["plan_and_act", "react"] = "plan_and_act"
     max_react_loop: int = 10  # used for react mode
+    max_concurrent_tasks: int = 1  # used for plan_and_act mode, take on up to this many ready tasks at the same time
+    _kernel_codes: dict[str, str] = PrivateAttr(default_factory=dict)  # task_id -> task code run in `execute_code`
 
     @model_validator(mode="after")
     def set_plan_and_tool(self) -> "Interpreter":
@@ -88,8 +91,72 @@ class DataInterpreter(Role):
     async def _plan_and_act(self) -> Message:
         rsp = await super()._plan_and_act()
         await self.execute_code.terminate()
+        self._kernel_codes.clear()
         return rsp
 
+    async def _act_on_tasks(self):
+        """With max_concurrent_tasks > 1, take on all ready tasks, i.e. those whose dependencies are finished, at once.
+        A lone ready task is taken on as usual, in the main notebook kernel. When several tasks are ready, each one
+        runs in its own worker with its own notebook kernel, and the results are processed in plan order."""
+        if self.max_concurrent_tasks <= 1:
+            return await super()._act_on_tasks()
+
+        while self.planner.current_task:
+            tasks = self.planner.plan.get_ready_tasks()[: self.max_concurrent_tasks]
+            if len(tasks) < 2:
+                task = self.planner.current_task
+                logger.info(f"ready to take on task {task}")
+                await self._sync_kernel(task)
+                task_result = await self._act_on_task(task)
+                self._kernel_codes[task.task_id] = task_result.code
+                await self.planner.process_task_result(task_result)
+                continue
+
+            logger.info(f"ready to take on tasks {[task.task_id for task in tasks]}")
+            workers = [self._create_task_worker(task) for task in tasks]
+            task_results = await asyncio.gather(*[self._act_on_task_in_worker(w, t) for w, t in zip(workers, tasks)])
+
+            for worker, task, task_result in zip(workers, tasks, task_results):
+                if self.planner.plan.task_map.get(task.task_id) is not task:
+                    continue  # replaced by a plan update when processing an earlier result, it will be taken on again
+                self.working_memory.add_batch(worker.working_memory.get())
+                await self.planner.process_task_result(task_result, task=task)
+
+    async def _sync_kernel(self, task: Task):
+        """Run the code of the task's dependencies that were finished by workers in the main kernel."""
+        for dep_task in self.planner.plan.get_dependency_tasks(task.task_id):
+            if dep_task.code and self._kernel_codes.get(dep_task.task_id) != dep_task.code:
+                await self.execute_code.run(dep_task.code)
+                self._kernel_codes[dep_task.task_id] = dep_task.code
+
+    def _create_task_worker(self, task: Task) -> "DataInterpreter":
+        """A DataInterpreter taking on only the task, the task's dependencies are the finished part of its plan."""
+        worker = DataInterpreter(auto_run=self.auto_run, use_reflection=self.use_reflection, context=self.context)
+        worker.llm = self.llm
+        worker.tools, worker.tool_recommender = self.tools, self.tool_recommender
+        worker.rc.memory.add(self.get_memories()[0])  # user requirement
+        plan = self.planner.plan
+        tasks = plan.get_dependency_tasks(task.task_id) + [task]
+        worker.planner.plan = Plan(
+            goal=plan.goal,
+            context=plan.context,
+            tasks=tasks,
+            task_map={t.task_id: t for t in tasks},
+            current_task_id=task.task_id,
+        )
+        return worker
+
+    @staticmethod
+    async def _act_on_task_in_worker(worker: "DataInterpreter", task: Task) -> TaskResult:
+        try:
+            # bring the fresh kernel to the state the task depends on
+            for dep_task in worker.planner.plan.get_finished_tasks():
+                if dep_task.code:
+                    await worker.execute_code.run(dep_task.code)
+            return await worker._act_on_task(task)
+        finally:
+            await worker.execute_code.terminate()
+
     async def _act_on_task(self, current_task: Task) -> TaskResult:
         """Useful in 'plan_and_act' mode. Wrap the output in a TaskResult for review and confirmation."""
         code, result, is_success = await self._write_and_exec_code()
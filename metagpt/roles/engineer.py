@@ -19,15 +19,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import re
 from collections import defaultdict
 from pathlib import Path
 from typing import Set
 
 from metagpt.actions import Action, WriteCode, WriteCodeReview, WriteTasks
 from metagpt.actions.fix_bug import FixBug
-from metagpt.actions.project_management_an import REFINED_TASK_LIST, TASK_LIST
+from metagpt.actions.project_management_an import (
+    LOGIC_ANALYSIS,
+    REFINED_LOGIC_ANALYSIS,
+    REFINED_TASK_LIST,
+    TASK_LIST,
+)
 from metagpt.actions.summarize_code import SummarizeCode
+from metagpt.actions.write_code import CodeContext
 from metagpt.actions.write_code_plan_and_change_an import WriteCodePlanAndChange
 from metagpt.const import (
     CODE_PLAN_AND_CHANGE_FILE_REPO,
@@ -66,8 +74,12 @@ class Engineer(Role):
         profile (str): Role profile, default is 'Engineer'.
         goal (str): Goal of the engineer.
         constraints (str): Constraints for the engineer.
-        n_borg (int): Number of borgs.
+        n_borg (int): Number of borgs, i.e. the number of files written or summarized at the same time when
+            `concurrent_coding` is on.
         use_code_review (bool): Whether to use code review.
+        concurrent_coding (bool): Whether to write the files that do not depend on each other at the same time. It is
+            faster, but a file no longer sees the code of the files its Logic Analysis does not mention, so the code
+            written can differ from writing one file at a time, which is the default.
     """
 
     name: str = "Alex"
@@ -79,6 +91,7 @@ class Engineer(Role):
     )
     n_borg: int = 1
     use_code_review: bool = False
+    concurrent_coding: bool = False
     code_todos: list = []
     summarize_todos: list = []
     next_todo_action: str = ""
@@ -100,42 +113,132 @@ class Engineer(Role):
 
     async def _act_sp_with_cr(self, review=False) -> Set[str]:
         changed_files = set()
+        code_context = CodeContext()  # the todos share the source files read and written in this run
         for todo in self.code_todos:
-            """
-            # Select essential information from the historical data to reduce the length of the prompt (summarized from human experience):
-            1. All from Architect
-            2. All from ProjectManager
-            3. Do we need other codes (currently needed)?
-            TODO: The goal is not to need it. After clear task decomposition, based on the design idea, you should be able to write a single file without needing other codes. If you can't, it means you need a clearer definition. This is the key to writing longer code.
-            """
-            coding_context = await todo.run()
-            # Code review
-            if review:
-                action = WriteCodeReview(i_context=coding_context, context=self.context, llm=self.llm)
-                self._init_action(action)
-                coding_context = await action.run()
-
-            dependencies = {coding_context.design_doc.root_relative_path, coding_context.task_doc.root_relative_path}
-            if self.config.inc:
-                dependencies.add(coding_context.code_plan_and_change_doc.root_relative_path)
-            await self.project_repo.srcs.save(
-                filename=coding_context.filename,
-                dependencies=list(dependencies),
-                content=coding_context.code_doc.content,
-            )
-            msg = Message(
-                content=coding_context.model_dump_json(),
-                instruct_content=coding_context,
-                role=self.profile,
-                cause_by=WriteCode,
-            )
-            self.rc.memory.add(msg)
-
-            changed_files.add(coding_context.code_doc.filename)
+            todo.code_context = code_context
+        if self.concurrent_coding and self.n_borg > 1:
+            changed_files = await self._act_sp_with_cr_concurrently(review=review)
+        else:
+            for todo in self.code_todos:
+                changed_files.add(await self._write_code_todo(todo, review=review))
         if not changed_files:
             logger.info("Nothing has changed.")
         return changed_files
 
+    async def _act_sp_with_cr_concurrently(self, review=False) -> Set[str]:
+        """Write up to `n_borg` files at the same time, a file is started once the files it depends on are written."""
+        dependencies = self._get_code_todo_dependencies()
+        written = {todo.i_context.filename: asyncio.Event() for todo in self.code_todos}
+        semaphore = asyncio.Semaphore(self.n_borg)
+
+        async def _write(todo: WriteCode) -> str:
+            try:
+                for filename in dependencies[todo.i_context.filename]:
+                    await written[filename].wait()
+                async with semaphore:
+                    return await self._write_code_todo(todo, review=review)
+            finally:
+                written[todo.i_context.filename].set()
+
+        return set(await self._gather_or_cancel([_write(todo) for todo in self.code_todos]))
+
+    @staticmethod
+    async def _gather_or_cancel(coros: list) -> list:
+        """Like `asyncio.gather`, but if one of the coroutines fails, cancel the others and wait for them to finish
+        before raising, so that none of them keeps writing to the repo."""
+        tasks = [asyncio.ensure_future(i) for i in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _get_code_todo_dependencies(self) -> dict[str, Set[str]]:
+        """Map the file of each code todo to the files of earlier todos it depends on.
+
+        A file of the Task List depends on an earlier file if its entry in the Logic Analysis of the task mentions the
+        earlier file by its whole name or module, e.g. "from game import Game", or if the earlier file is not in the
+        Task List. A file without an entry, not in the Task List or with an unreadable task depends on all earlier
+        files.
+        """
+        dependencies = {}
+        filenames = []
+        for todo in self.code_todos:
+            filename = todo.i_context.filename
+            task_list, analysis = self._get_logic_analysis(todo)
+            if analysis is None or filename not in task_list:
+                dependencies[filename] = set(filenames)
+            else:
+                dependencies[filename] = {i for i in filenames if i not in task_list or self._mentions(analysis, i)}
+            filenames.append(filename)
+        return dependencies
+
+    @staticmethod
+    def _get_logic_analysis(todo: WriteCode) -> tuple[list[str], str | None]:
+        """Return the Task List of the todo's task and the entry of the todo's file in its Logic Analysis, the entry is
+        None if the file has none or the task can not be parsed."""
+        coding_context = CodingContext.loads(todo.i_context.content)
+        if not coding_context.task_doc or not coding_context.task_doc.content:
+            return [], None
+        try:
+            m = json.loads(coding_context.task_doc.content)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse the task of {coding_context.filename}: {e}")
+            return [], None
+        if not isinstance(m, dict):
+            return [], None
+        task_list = m.get(TASK_LIST.key) or m.get(REFINED_TASK_LIST.key) or []
+        for item in m.get(LOGIC_ANALYSIS.key) or m.get(REFINED_LOGIC_ANALYSIS.key) or []:
+            if item and item[0] == coding_context.filename:
+                return task_list, " ".join(item[1:])
+        return task_list, None
+
+    @staticmethod
+    def _mentions(text: str, filename: str) -> bool:
+        """Whether the text mentions the file by its whole path, name, module or stem, e.g. "game/board.py",
+        "board.py", "game.board" or "board", rather than as part of a longer name such as "board_view"."""
+        path = Path(filename)
+        names = {path.as_posix(), path.name, path.with_suffix("").as_posix().replace("/", "."), path.stem}
+        pattern = "|".join(re.escape(i) for i in sorted(names, key=len, reverse=True))
+        return re.search(rf"(?<![\w./-])(?:{pattern})(?![\w/-])", text) is not None
+
+    async def _write_code_todo(self, todo: WriteCode, review=False) -> str:
+        """
+        # Select essential information from the historical data to reduce the length of the prompt (summarized from human experience):
+        1. All from Architect
+        2. All from ProjectManager
+        3. Do we need other codes (currently needed)?
+        TODO: The goal is not to need it. After clear task decomposition, based on the design idea, you should be able to write a single file without needing other codes. If you can't, it means you need a clearer definition. This is the key to writing longer code.
+        """
+        coding_context = await todo.run()
+        # Code review
+        if review:
+            action = WriteCodeReview(i_context=coding_context, context=self.context, llm=self.llm)
+            self._init_action(action)
+            coding_context = await action.run()
+
+        dependencies = {coding_context.design_doc.root_relative_path, coding_context.task_doc.root_relative_path}
+        if self.config.inc:
+            dependencies.add(coding_context.code_plan_and_change_doc.root_relative_path)
+        await self.project_repo.srcs.save(
+            filename=coding_context.filename,
+            dependencies=list(dependencies),
+            content=coding_context.code_doc.content,
+        )
+        if todo.code_context:
+            todo.code_context.update(self.project_repo.srcs, coding_context.filename, coding_context.code_doc.content)
+        msg = Message(
+            content=coding_context.model_dump_json(),
+            instruct_content=coding_context,
+            role=self.profile,
+            cause_by=WriteCode,
+        )
+        self.rc.memory.add(msg)
+
+        return coding_context.code_doc.filename
+
     async def _act(self) -> Message | None:
         """Determines the mode of action based on whether code review is used."""
         if self.rc.todo is None:
@@ -163,8 +266,14 @@ class Engineer(Role):
 
     async def _act_summarize(self):
         tasks = []
-        for todo in self.summarize_todos:
-            summary = await todo.run()
+        semaphore = asyncio.Semaphore(self.n_borg if self.concurrent_coding else 1)
+
+        async def _summarize(todo: SummarizeCode) -> str:
+            async with semaphore:
+                return await todo.run()
+
+        summaries = await self._gather_or_cancel([_summarize(todo) for todo in self.summarize_todos])
+        for todo, summary in zip(self.summarize_todos, summaries):
             summary_filename = Path(todo.i_context.design_filename).with_suffix(".md").name
             dependencies = {todo.i_context.design_filename, todo.i_context.task_filename}
             for filename in todo.i_context.codes_filenames:
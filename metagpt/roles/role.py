@@ -25,7 +25,14 @@ from __future__ import annotations
 from enum import Enum
 from typing import TYPE_CHECKING, Iterable, Optional, Set, Type, Union
 
-from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializeAsAny,
+    model_validator,
+)
 
 from metagpt.actions import Action, ActionOutput
 from metagpt.actions.action_node import ActionNode
@@ -107,6 +114,10 @@ class RoleContext(BaseModel):
         RoleReactMode.REACT
     )  # see `Role._set_react_mode` for definitions of the following two attributes
     max_react_loop: int = 1
+    history_window: int = 50  # latest messages shown to `Role._think` when choosing the next state, 0 for all
+
+    _rendered_history: list[str] = PrivateAttr(default_factory=list)  # str() of memory messages, see `render_history`
+    _rendered_last: Optional[Message] = PrivateAttr(default=None)
 
     @property
     def important_memory(self) -> list[Message]:
@@ -117,6 +128,20 @@ class RoleContext(BaseModel):
     def history(self) -> list[Message]:
         return self.memory.get()
 
+    def render_history(self) -> str:
+        """Render the latest `history_window` messages of `history` as `str(history)` would, only formatting the
+        messages added to memory since the previous call."""
+        storage = self.memory.storage
+        rendered = self._rendered_history
+        n = len(rendered)
+        if len(storage) < n or (n and storage[n - 1] is not self._rendered_last):
+            rendered.clear()  # messages were deleted from memory, render it again
+            n = 0
+        rendered.extend(str(m) for m in storage[n:])
+        self._rendered_last = storage[-1] if storage else None
+        window = rendered[-self.history_window :] if self.history_window else rendered
+        return f"[{', '.join(window)}]"
+
     @classmethod
     def model_rebuild(cls, **kwargs):
         from metagpt.environment.base_env import Environment  # noqa: F401
@@ -206,7 +231,7 @@ class Role(SerializationMixin, ContextMixin, BaseModel):
 
     @property
     def project_repo(self) -> ProjectRepo:
-        project_repo = ProjectRepo(self.context.git_repo)
+        project_repo = self.context.project_repo()
         return project_repo.with_src_path(self.context.src_workspace) if self.context.src_workspace else project_repo
 
     @property
@@ -367,7 +392,7 @@ class Role(SerializationMixin, ContextMixin, BaseModel):
 
         prompt = self._get_prefix()
         prompt += STATE_TEMPLATE.format(
-            history=self.rc.history,
+            history=self.rc.render_history(),
             states="\n".join(self.states),
             n_states=len(self.states) - 1,
             previous_state=self.rc.state,
@@ -391,17 +416,19 @@ class Role(SerializationMixin, ContextMixin, BaseModel):
         logger.info(f"{self._setting}: to do {self.rc.todo}({self.rc.todo.name})")
         response = await self.rc.todo.run(self.rc.history)
         if isinstance(response, (ActionOutput, ActionNode)):
-            msg = Message(
+            msg = Message.fast(
                 content=response.content,
                 instruct_content=response.instruct_content,
                 role=self._setting,
-                cause_by=self.rc.todo,
-                sent_from=self,
+                cause_by=any_to_str(self.rc.todo),
+                sent_from=any_to_str(self),
             )
         elif isinstance(response, Message):
             msg = response
         else:
-            msg = Message(content=response, role=self.profile, cause_by=self.rc.todo, sent_from=self)
+            msg = Message.fast(
+                content=response, role=self.profile, cause_by=any_to_str(self.rc.todo), sent_from=any_to_str(self)
+            )
         self.rc.memory.add(msg)
 
         return msg
@@ -415,11 +442,13 @@ class Role(SerializationMixin, ContextMixin, BaseModel):
         if not news:
             news = self.rc.msg_buffer.pop_all()
         # Store the read messages in your own memory to prevent duplicate processing.
-        old_messages = [] if ignore_memory else self.rc.memory.get()
+        seen = [False] * len(news) if ignore_memory else [self.rc.memory.contains(n) for n in news]
         self.rc.memory.add_batch(news)
         # Filter out messages of interest.
         self.rc.news = [
-            n for n in news if (n.cause_by in self.rc.watch or self.name in n.send_to) and n not in old_messages
+            n
+            for n, is_seen in zip(news, seen)
+            if (n.cause_by in self.rc.watch or self.name in n.send_to) and not is_seen
         ]
         self.latest_observed_msg = self.rc.news[-1] if self.rc.news else None  # record the latest observed msg
 
@@ -445,6 +474,8 @@ class Role(SerializationMixin, ContextMixin, BaseModel):
         if not message:
             return
         self.rc.msg_buffer.push(message)
+        if self.rc.env:
+            self.rc.env.notify_ready(self)
 
     async def _react(self) -> Message:
         """Think first, then act, until the Role _think it is time to stop and requires no more todo.
@@ -452,7 +483,7 @@ class Role(SerializationMixin, ContextMixin, BaseModel):
         Use llm to select actions in _think dynamically
         """
         actions_taken = 0
-        rsp = Message(content="No actions taken yet", cause_by=Action)  # will be overwritten after Role _act
+        rsp = Message.fast(content="No actions taken yet", cause_by=any_to_str(Action))  # overwritten after Role _act
         while actions_taken < self.rc.max_react_loop:
             # think
             await self._think()
@@ -467,7 +498,7 @@ class Role(SerializationMixin, ContextMixin, BaseModel):
     async def _act_by_order(self) -> Message:
         """switch action each time by order defined in _init_actions, i.e. _act (Action1) -> _act (Action2) -> ..."""
         start_idx = self.rc.state if self.rc.state >= 0 else 0  # action to run from recovered state
-        rsp = Message(content="No actions taken yet")  # return default message if actions=[]
+        rsp = Message.fast(content="No actions taken yet")  # return default message if actions=[]
         for i in range(start_idx, len(self.states)):
             self._set_state(i)
             rsp = await self._act()
@@ -481,6 +512,16 @@ class Role(SerializationMixin, ContextMixin, BaseModel):
         await self.planner.update_plan(goal=goal)
 
         # take on tasks until all finished
+        await self._act_on_tasks()
+
+        rsp = self.planner.get_useful_memories()[0]  # return the completed plan as a response
+
+        self.rc.memory.add(rsp)  # add to persistent memory
+
+        return rsp
+
+    async def _act_on_tasks(self):
+        """Take on the tasks of the plan one by one until all are finished"""
         while self.planner.current_task:
             task = self.planner.current_task
             logger.info(f"ready to take on task {task}")
@@ -491,12 +532,6 @@ class Role(SerializationMixin, ContextMixin, BaseModel):
             # process the result, such as reviewing, confirming, plan updating
             await self.planner.process_task_result(task_result)
 
-        rsp = self.planner.get_useful_memories()[0]  # return the completed plan as a response
-
-        self.rc.memory.add(rsp)  # add to persistent memory
-
-        return rsp
-
     async def _act_on_task(self, current_task: Task) -> TaskResult:
         """Taking specific action to handle one task in plan
 
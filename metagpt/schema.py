@@ -15,15 +15,17 @@
 
 from __future__ import annotations
 
-import asyncio
+import importlib
 import json
 import os.path
+import re
 import uuid
 from abc import ABC
-from asyncio import Queue, QueueEmpty, wait_for
+from asyncio import Queue, QueueEmpty
+from collections import deque
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar, Union
+from typing import Any, Deque, Dict, Iterable, List, Optional, TextIO, Type, TypeVar, Union
 
 from pydantic import (
     BaseModel,
@@ -50,9 +52,8 @@ from metagpt.repo_parser import DotClassInfo
 from metagpt.utils.common import any_to_str, any_to_str_set, import_class
 from metagpt.utils.exceptions import handle_exception
 from metagpt.utils.serialize import (
-    actionoutout_schema_to_mapping,
-    actionoutput_mapping_to_str,
-    actionoutput_str_to_mapping,
+    get_instruct_content_class,
+    get_instruct_content_meta,
 )
 
 
@@ -93,7 +94,7 @@ class SerializationMixin(BaseModel, extra="forbid"):
         if not cls.__is_polymorphic_base:
             if class_full_name is None:
                 return handler(value)
-            elif str(cls) == f"<class '{class_full_name}'>":
+            elif class_full_name == f"{cls.__module__}.{cls.__qualname__}":
                 return handler(value)
             else:
                 # f"Trying to instantiate {class_full_name} but this is not the polymorphic base class")
@@ -104,14 +105,33 @@ class SerializationMixin(BaseModel, extra="forbid"):
         if class_full_name is None:
             raise ValueError("Missing __module_class_name field")
 
-        class_type = cls.__subclasses_map__.get(class_full_name, None)
+        class_type = cls.get_registered_class(class_full_name)
 
         if class_type is None:
-            # TODO could try dynamic import
-            raise TypeError("Trying to instantiate {class_full_name}, which has not yet been defined!")
+            raise TypeError(f"Trying to instantiate {class_full_name}, which has not yet been defined!")
 
         return class_type(**value)
 
+    @classmethod
+    def get_registered_class(cls, class_full_name: str) -> Optional[Type["SerializationMixin"]]:
+        """Return the subclass registered under `class_full_name`.
+
+        Subclasses register themselves in `__subclasses_map__` when they are defined, so this is a dict lookup; the
+        module is only imported when the class has not been defined in this process yet.
+        """
+        class_type = cls.__subclasses_map__.get(class_full_name)
+        if class_type is not None:
+            return class_type
+
+        parts = class_full_name.split(".")
+        for i in range(len(parts) - 1, 0, -1):  # `__qualname__` may be dotted, so try the longest module path first
+            try:
+                importlib.import_module(".".join(parts[:i]))
+            except ImportError:
+                continue
+            break
+        return cls.__subclasses_map__.get(class_full_name)
+
     def __init_subclass__(cls, is_polymorphic_base: bool = False, **kwargs):
         cls.__is_polymorphic_base = is_polymorphic_base
         cls.__subclasses_map__[f"{cls.__module__}.{cls.__qualname__}"] = cls
@@ -207,9 +227,7 @@ class Message(BaseModel):
         if ic and isinstance(ic, dict) and "class" in ic:
             if "mapping" in ic:
                 # compatible with custom-defined ActionOutput
-                mapping = actionoutput_str_to_mapping(ic["mapping"])
-                actionnode_class = import_class("ActionNode", "metagpt.actions.action_node")  # avoid circular import
-                ic_obj = actionnode_class.create_model_class(class_name=ic["class"], mapping=mapping)
+                ic_obj = get_instruct_content_class(ic["class"], ic["mapping"])
             elif "module" in ic:
                 # subclasses of BaseModel
                 ic_obj = import_class(ic["class"], ic["module"])
@@ -242,23 +260,39 @@ class Message(BaseModel):
         ic_dict = None
         if ic:
             # compatible with custom-defined ActionOutput
-            schema = ic.model_json_schema()
-            ic_type = str(type(ic))
-            if "<class 'metagpt.actions.action_node" in ic_type:
-                # instruct_content from AutoNode.create_model_class, for now, it's single level structure.
-                mapping = actionoutout_schema_to_mapping(schema)
-                mapping = actionoutput_mapping_to_str(mapping)
-
-                ic_dict = {"class": schema["title"], "mapping": mapping, "value": ic.model_dump()}
-            else:
-                # due to instruct_content can be assigned by subclasses of BaseModel
-                ic_dict = {"class": schema["title"], "module": ic.__module__, "value": ic.model_dump()}
+            ic_dict = {**get_instruct_content_meta(type(ic)), "value": ic.model_dump()}
         return ic_dict
 
     def __init__(self, content: str = "", **data: Any):
         data["content"] = data.get("content", content)
         super().__init__(**data)
 
+    @classmethod
+    def fast(
+        cls,
+        content: str = "",
+        instruct_content: Optional[BaseModel] = None,
+        role: str = "user",
+        cause_by: str = "",
+        sent_from: str = "",
+        send_to: Optional[set[str]] = None,
+        id: str = "",
+    ) -> "Message":
+        """Build a message for trusted internal call sites without running any validator.
+
+        Routes must already be normalized: `cause_by` and `sent_from` are strings (e.g. from `any_to_str`), `send_to`
+        is a set of strings, and `instruct_content` is a `BaseModel` instance rather than its serialized dict.
+        """
+        return cls.model_construct(
+            id=id or uuid.uuid4().hex,
+            content=content,
+            instruct_content=instruct_content,
+            role=role,
+            cause_by=cause_by or cls.check_cause_by(cause_by),
+            sent_from=sent_from,
+            send_to=send_to or {MESSAGE_ROUTE_TO_ALL},
+        )
+
     def __setattr__(self, key, val):
         """Override `@property.setter`, convert non-string parameters into string parameters."""
         if key == MESSAGE_ROUTE_CAUSE_BY:
@@ -520,8 +554,41 @@ class Plan(BaseModel):
     def finish_current_task(self):
         """Finish current task, set Task.is_finished=True, set current task to next task"""
         if self.current_task_id:
-            self.current_task.is_finished = True
-            self._update_current_task()  # set to next task
+            self.finish_task(self.current_task_id)
+
+    def finish_task(self, task_id: str):
+        """Finish the task of task_id, set Task.is_finished=True, set current task to the first unfinished task"""
+        if task_id in self.task_map:
+            self.task_map[task_id].is_finished = True
+            self._update_current_task()
+
+    def get_ready_tasks(self) -> list[Task]:
+        """return the unfinished tasks whose dependencies are all finished, i.e. the tasks that can be taken on now
+
+        Returns:
+            list[Task]: list of ready tasks in correct linearized order
+        """
+        return [
+            task
+            for task in self.tasks
+            if not task.is_finished
+            and all(self.task_map[dep_id].is_finished for dep_id in task.dependent_task_ids if dep_id in self.task_map)
+        ]
+
+    def get_dependency_tasks(self, task_id: str) -> list[Task]:
+        """return all tasks the task of task_id depends on, directly or indirectly, in correct linearized order
+
+        Returns:
+            list[Task]: list of dependency tasks
+        """
+        dep_ids = set()
+        stack = list(self.task_map[task_id].dependent_task_ids)
+        while stack:
+            dep_id = stack.pop()
+            if dep_id not in dep_ids and dep_id in self.task_map:
+                dep_ids.add(dep_id)
+                stack.extend(self.task_map[dep_id].dependent_task_ids)
+        return [task for task in self.tasks if task.task_id in dep_ids]
 
     def get_finished_tasks(self) -> list[Task]:
         """return all finished tasks in correct linearized order
@@ -567,27 +634,25 @@ class MessageQueue(BaseModel):
         """Return true if the queue is empty."""
         return self._queue.empty()
 
+    def snapshot(self) -> List[Message]:
+        """Return the queued messages in order, leaving the queue unchanged."""
+        msgs = []
+        # Nothing is awaited between draining and refilling, so no other coroutine can observe the queue half empty.
+        while True:
+            try:
+                msgs.append(self._queue.get_nowait())
+                self._queue.task_done()
+            except QueueEmpty:
+                break
+        for m in msgs:
+            self._queue.put_nowait(m)
+        return msgs
+
     async def dump(self) -> str:
         """Convert the `MessageQueue` object to a json string."""
         if self.empty():
             return "[]"
-
-        lst = []
-        msgs = []
-        try:
-            while True:
-                item = await wait_for(self._queue.get(), timeout=1.0)
-                if item is None:
-                    break
-                msgs.append(item)
-                lst.append(item.dump())
-                self._queue.task_done()
-        except asyncio.TimeoutError:
-            logger.debug("Queue is empty, exiting...")
-        finally:
-            for m in msgs:
-                self._queue.put_nowait(m)
-        return json.dumps(lst, ensure_ascii=False)
+        return json.dumps([m.dump() for m in self.snapshot()], ensure_ascii=False)
 
     @staticmethod
     def load(data) -> "MessageQueue":
@@ -608,6 +673,78 @@ class MessageQueue(BaseModel):
 T = TypeVar("T", bound="BaseModel")
 
 
+class MessageHistory(BaseModel):
+    """Bounded record of published messages, rendered to text only on demand.
+
+    Only the newest `max_size` messages are kept in memory (all of them if `max_size` is None). If `spill_path` is set,
+    every message is also appended to that JSONL file when it is added, so evicted messages remain available on disk.
+    The file is kept open for appending until `close`.
+    """
+
+    max_size: Optional[int] = 1000
+    spill_path: Optional[Path] = None
+    storage: Deque[Message] = Field(default_factory=deque)
+
+    _spill_writer: Optional[TextIO] = PrivateAttr(default=None)
+
+    @model_validator(mode="before")
+    @classmethod
+    def check_rendered(cls, data: Any) -> Any:
+        if not isinstance(data, str):
+            return data
+        # Checkpoints written before `MessageHistory` stored the history as its rendered text, "\n{role}: {content}"
+        # per message. Split it at the lines starting with a role, so that the history renders to the same text.
+        if data:
+            logger.warning("Convert a history saved as rendered text, messages are split at lines like 'role: '")
+        storage = []
+        for entry in re.split(r"\n(?=[^\n:]+: )", data):
+            if entry:
+                role, _, content = entry.partition(": ")
+                storage.append(Message(content=content, role=role))
+        return {"storage": storage}
+
+    @model_validator(mode="after")
+    def check_storage(self) -> "MessageHistory":
+        self.storage = deque(self.storage, maxlen=self.max_size)
+        return self
+
+    @field_serializer("storage", mode="wrap")
+    def ser_storage(self, storage: Deque[Message], default_serializer) -> list:
+        return list(default_serializer(storage))
+
+    def add(self, message: Message):
+        """Append a message, evicting the oldest one if the history is full."""
+        self.storage.append(message)
+        if self.spill_path:
+            if self._spill_writer is None:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill_writer = open(self.spill_path, "a", encoding="utf-8", buffering=1)  # line buffered
+            self._spill_writer.write(message.dump() + "\n")
+
+    def close(self):
+        """Close the spill file, it is opened again by the next `add`."""
+        if self._spill_writer is not None:
+            self._spill_writer.close()
+            self._spill_writer = None
+
+    def get(self, k=0) -> list[Message]:
+        """Return the most recent k messages, return all when k=0"""
+        if not k:
+            return list(self.storage)
+        n = len(self.storage)
+        return [self.storage[i] for i in range(max(n - k, 0), n)]
+
+    def render(self) -> str:
+        """Render the kept messages as the newline-separated text log."""
+        return "".join(f"\n{message}" for message in self.storage)
+
+    def __len__(self):
+        return len(self.storage)
+
+    def __str__(self):
+        return self.render()
+
+
 class BaseContext(BaseModel, ABC):
     @classmethod
     @handle_exception
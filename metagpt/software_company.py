@@ -8,7 +8,8 @@ from datetime import datetime
 import typer
 import random
 
-from metagpt.const import CONFIG_ROOT
+from metagpt.const import CONFIG_ROOT, DEFAULT_WORKSPACE_ROOT
+from metagpt.logs import logger
 from metagpt.utils.project_repo import ProjectRepo
 
 
@@ -17,6 +18,42 @@ from swarm_prompt.prompt_swarm_robot import UserRequirement, task_name
 
 app = typer.Typer(add_completion=False, pretty_exceptions_show_locals=False)
 
+SWARM_WORKSPACE_ROOT = DEFAULT_WORKSPACE_ROOT / "metagpt" / task_name
+
+
+def new_project_name() -> str:
+    """Return a unique project name for one generation run of the current swarm task."""
+    return f"{task_name}_{datetime.now().strftime('%Y%m%d_%H%M%S.%f')[:-3]}_{random.randint(1000000, 9999999)}"
+
+
+def hire_company(ctx, code_review=True, run_tests=False, implement=True):
+    """Build a new software company team on the given context."""
+    from metagpt.roles import (
+        Architect,
+        Engineer,
+        ProductManager,
+        ProjectManager,
+        QaEngineer,
+    )
+    from metagpt.team import Team
+
+    company = Team(context=ctx)
+    company.hire(
+        [
+            ProductManager(),
+            Architect(),
+            ProjectManager(),
+        ]
+    )
+
+    if implement or code_review:
+        company.hire([Engineer(n_borg=5, use_code_review=code_review)])
+
+    if run_tests:
+        company.hire([QaEngineer()])
+    return company
+
+
 def generate_repo(
     idea,
     investment=3.0,
@@ -34,33 +71,13 @@ def generate_repo(
     """Run the startup logic. Can be called from CLI or other Python scripts."""
     from metagpt.config2 import config
     from metagpt.context import Context
-    from metagpt.roles import (
-        Architect,
-        Engineer,
-        ProductManager,
-        ProjectManager,
-        QaEngineer,
-    )
     from metagpt.team import Team
 
     config.update_via_cli(project_path, project_name, inc, reqa_file, max_auto_summarize_code)
     ctx = Context(config=config)
 
     if not recover_path:
-        company = Team(context=ctx)
-        company.hire(
-            [
-                ProductManager(),
-                Architect(),
-                ProjectManager(),
-            ]
-        )
-
-        if implement or code_review:
-            company.hire([Engineer(n_borg=5, use_code_review=code_review)])
-
-        if run_tests:
-            company.hire([QaEngineer()])
+        company = hire_company(ctx, code_review, run_tests, implement)
     else:
         stg_path = Path(recover_path)
         if not stg_path.exists() or not str(stg_path).endswith("team"):
@@ -76,6 +93,52 @@ def generate_repo(
     return ctx.repo
 
 
+async def run_companies(
+    idea,
+    n_runs=1,
+    max_concurrency=10,
+    investment=3.0,
+    n_round=5,
+    code_review=True,
+    run_tests=False,
+    implement=True,
+    workspace_path=SWARM_WORKSPACE_ROOT,
+    max_auto_summarize_code=0,
+) -> list[ProjectRepo]:
+    """Run `n_runs` independent companies on the same idea in this process.
+
+    Each run gets its own `Config` copy and `Context`, and writes its project straight to
+    `workspace_path/<project_name>`. At most `max_concurrency` teams are alive at the same time.
+    """
+    from metagpt.config2 import config
+    from metagpt.context import Context
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run_one(run_no: int) -> ProjectRepo:
+        async with semaphore:
+            logger.info(f"Running the app for the {run_no + 1} time...")
+            run_config = config.model_copy(deep=True)
+            run_config.workspace.path = Path(workspace_path)
+            run_config.update_via_cli("", new_project_name(), False, "", max_auto_summarize_code)
+            ctx = Context(config=run_config)
+
+            company = hire_company(ctx, code_review, run_tests, implement)
+            company.invest(investment)
+            company.run_project(idea)
+            await company.run(n_round=n_round)
+            logger.info(f"Finished run {run_no + 1}: {run_config.project_path}")
+            return ctx.repo
+
+    Path(workspace_path).mkdir(parents=True, exist_ok=True)
+    return await asyncio.gather(*[_run_one(i) for i in range(n_runs)])
+
+
+def generate_repos(idea, n_runs=1, max_concurrency=10, **kwargs) -> list[ProjectRepo]:
+    """Run `n_runs` companies concurrently under one event loop. See `run_companies`."""
+    return asyncio.run(run_companies(idea, n_runs=n_runs, max_concurrency=max_concurrency, **kwargs))
+
+
 @app.command("", help="Start a new project.")
 def startup(
     idea: str = typer.Argument(UserRequirement, help="Your innovative idea, such as 'Create a 2048 game.'"),
@@ -84,7 +147,7 @@ def startup(
     code_review: bool = typer.Option(default=True, help="Whether to use code review."),
     run_tests: bool = typer.Option(default=False, help="Whether to enable QA for adding & running tests."),
     implement: bool = typer.Option(default=True, help="Enable or disable code implementation."),
-    project_name: str = typer.Option(default=f"{task_name}_{datetime.now().strftime('%Y%m%d_%H%M%S.%f')[:-3]}_{random.randint(1000000, 9999999)}", help="Unique project name."),
+    project_name: str = typer.Option(default=new_project_name(), help="Unique project name."),
     inc: bool = typer.Option(default=False, help="Incremental mode. Use it to coop with existing repo."),
     project_path: str = typer.Option(
         default="",
@@ -100,6 +163,8 @@ def startup(
     ),
     recover_path: str = typer.Option(default=None, help="recover the project from existing serialized storage"),
     init_config: bool = typer.Option(default=False, help="Initialize the configuration file for MetaGPT."),
+    n_runs: int = typer.Option(default=1, help="Number of independent projects to generate in this process."),
+    max_concurrency: int = typer.Option(default=10, help="Maximum number of projects generated at the same time."),
 ):
     """Run a startup. Be a boss."""
     if init_config:
@@ -110,6 +175,19 @@ def startup(
         typer.echo("Missing argument 'IDEA'. Run 'metagpt --help' for more information.")
         raise typer.Exit()
 
+    if n_runs > 1:
+        return generate_repos(
+            idea,
+            n_runs=n_runs,
+            max_concurrency=max_concurrency,
+            investment=investment,
+            n_round=n_round,
+            code_review=code_review,
+            run_tests=run_tests,
+            implement=implement,
+            max_auto_summarize_code=max_auto_summarize_code,
+        )
+
     return generate_repo(
         idea,
         investment,
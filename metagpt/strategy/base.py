@@ -38,6 +38,8 @@ class ThoughtNode(Node):
     value: int = 0
     id: int = 0
     valid_status: bool = True
+    visit_count: int = 0  # only for mcts
+    total_value: float = 0  # only for mcts, sum of the rewards backed up through the node
 
     def update_value(self, value) -> None:
         """Update the value of the thought node."""
@@ -90,7 +90,16 @@ class Planner(BaseModel):
 
         self.working_memory.clear()
 
-    async def process_task_result(self, task_result: TaskResult):
+    async def process_task_result(self, task_result: TaskResult, task: Task = None):
+        """Review the result of the task, the current task by default. Another task is made the current task of the
+        plan while its result is reviewed and the plan is updated, so that both refer to that task."""
+        if task and task is not self.current_task:
+            self.plan.current_task_id = task.task_id
+            try:
+                return await self.process_task_result(task_result)
+            finally:
+                self.plan._update_current_task()  # back to the first unfinished task
+
         # ask for acceptance, users can other refuse and change tasks in the plan
         review, task_result_confirmed = await self.ask_review(task_result)
 
@@ -133,7 +142,7 @@ class Planner(BaseModel):
 
     async def confirm_task(self, task: Task, task_result: TaskResult, review: str):
         task.update_task_result(task_result=task_result)
-        self.plan.finish_current_task()
+        self.plan.finish_task(task.task_id)
         self.working_memory.clear()
 
         confirmed_and_more = (
@@ -5,6 +5,7 @@
 @Author  : alexanderwu
 @File    : solver.py
 """
+import asyncio
 from abc import abstractmethod
 
 from metagpt.actions.action_graph import ActionGraph
@@ -33,13 +34,68 @@ class BaseSolver:
 
 
 class NaiveSolver(BaseSolver):
-    """NaiveSolver: Iterate all the nodes in the graph and execute them one by one."""
+    """NaiveSolver: Execute every node in the graph as soon as all of its predecessors are done."""
 
-    async def solve(self):
+    async def solve(self, max_concurrency: int = 5):
+        """
+        :param max_concurrency: The maximum number of nodes filled at the same time.
+        :raises ValueError: If an edge has an endpoint that is not a node of the graph, or the graph has a cycle.
+        """
+        prevs = self._get_prevs()
         self.graph.topological_sort()
-        for key in self.graph.execution_order:
-            op = self.graph.nodes[key]
-            await op.fill(self.context, self.llm, mode="root")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fill(key):
+            async with semaphore:
+                await self.graph.nodes[key].fill(self._node_context(key, prevs[key]), self.llm, mode="root")
+
+        done, running = set(), {}
+        try:
+            while len(done) < len(self.graph.nodes):
+                for key in self.graph.execution_order:
+                    if key not in done and key not in running and prevs[key] <= done:
+                        running[key] = asyncio.create_task(_fill(key))
+                await asyncio.wait(running.values(), return_when=asyncio.FIRST_COMPLETED)
+                for key, task in list(running.items()):
+                    if task.done():
+                        task.result()
+                        done.add(key)
+                        running.pop(key)
+        finally:
+            for task in running.values():
+                task.cancel()
+
+    def _get_prevs(self) -> dict[str, set[str]]:
+        """Map each node to its predecessors, checking that the graph is a DAG of its nodes."""
+        prevs = {key: set() for key in self.graph.nodes}
+        for from_key, to_keys in self.graph.edges.items():
+            for to_key in to_keys:
+                unknown = [i for i in (from_key, to_key) if i not in prevs]
+                if unknown:
+                    raise ValueError(f"Edge {from_key} -> {to_key} has endpoints that are not nodes: {unknown}")
+                prevs[to_key].add(from_key)
+
+        # remove the nodes without predecessors until none is left, what remains is on or behind a cycle
+        pending = {key: set(keys) for key, keys in prevs.items()}
+        while True:
+            free = [key for key, keys in pending.items() if not keys]
+            if not free:
+                break
+            for key in free:
+                pending.pop(key)
+            for keys in pending.values():
+                keys.difference_update(free)
+        if pending:
+            raise ValueError(f"The graph has a cycle among the nodes {sorted(pending)}")
+        return prevs
+
+    def _node_context(self, key, prev_keys):
+        """The solver context followed by the outputs of the node's predecessors, in execution order."""
+        if not prev_keys:
+            return self.context
+        outputs = [f"## {k}\n{self.graph.nodes[k].get(k)}" for k in self.graph.execution_order if k in prev_keys]
+        return "\n\n".join([str(self.context)] + outputs)
 
 
 class TOTSolver(BaseSolver):
@@ -5,9 +5,10 @@
 from __future__ import annotations
 
 import asyncio
+import math
 from typing import Any, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from metagpt.llm import LLM
 from metagpt.logs import logger
@@ -37,10 +38,24 @@ class ThoughtSolverBase(BaseModel):
     llm: BaseLLM = Field(default_factory=LLM, exclude=True)
     config: ThoughtSolverConfig = Field(default_factory=ThoughtSolverConfig)
 
+    _eval_cache: dict = PrivateAttr(default_factory=dict)  # cache key -> future of the evaluation value
+    _eval_cache_hits: int = PrivateAttr(default=0)
+    _eval_cache_lookups: int = PrivateAttr(default=0)
+
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
         self.llm.use_system_prompt = False
 
+    @property
+    def eval_cache_hit_rate(self) -> float:
+        """The share of node evaluations answered by the evaluation cache in the current solve."""
+        return self._eval_cache_hits / self._eval_cache_lookups if self._eval_cache_lookups else 0.0
+
+    def reset_eval_cache(self) -> None:
+        self._eval_cache = {}
+        self._eval_cache_hits = 0
+        self._eval_cache_lookups = 0
+
     async def solve(self, init_prompt):
         """
         Solve method for subclasses to implement.
@@ -80,15 +95,34 @@ class ThoughtSolverBase(BaseModel):
             None
         """
         eval_prompt = self.config.parser.value(input=node.name, **{"node_id": node.id})
-        evaluation = await self.llm.aask(msg=eval_prompt)
+        if self.config.canonicalizer:
+            key = self.config.canonicalizer(node.name)
+        else:
+            key = " ".join(eval_prompt.split())
 
-        value = self.config.evaluator(evaluation, **{"node_id": node.id})
+        # equal states are evaluated once, even when their evaluations are requested at the same time
+        self._eval_cache_lookups += 1
+        if key in self._eval_cache:
+            self._eval_cache_hits += 1
+        else:
+            self._eval_cache[key] = asyncio.ensure_future(self._evaluate(eval_prompt, node_id=node.id))
+        future = self._eval_cache[key]
+        try:
+            value = await asyncio.shield(future)
+        except Exception:
+            if self._eval_cache.get(key) is future:
+                del self._eval_cache[key]  # let the next request of the state try again
+            raise
         status = self.config.evaluator.status_verify(value)
 
         node.update_valid_status(status=status)
         # 累计分数
         node.update_value(parent_value + value)
 
+    async def _evaluate(self, eval_prompt: str, node_id: int) -> float:
+        evaluation = await self.llm.aask(msg=eval_prompt)
+        return self.config.evaluator(evaluation, **{"node_id": node_id})
+
     def select_nodes(self, thought_nodes: List[ThoughtNode]) -> List[ThoughtNode]:
         """
         Select nodes based on the configured selection method.
@@ -136,6 +170,7 @@ class BFSSolver(ThoughtSolverBase):
         """
         root = ThoughtNode(init_prompt)
         self.thought_tree = ThoughtTree(root)
+        self.reset_eval_cache()
         current_nodes = [root]
         for step in range(self.config.max_steps):
             solutions = await self._bfs_build(current_nodes)
@@ -147,6 +182,7 @@ class BFSSolver(ThoughtSolverBase):
 
         best_solution, best_solution_path = self.update_solution()
         logger.info(f"best solution is: {best_solution_path}")
+        logger.info(f"evaluation cache hit rate: {self.eval_cache_hit_rate:.2%}")
         return best_solution_path
 
     async def _bfs_build(self, current_nodes):
@@ -190,7 +226,7 @@ class DFSSolver(ThoughtSolverBase):
         """
         impossible_state_cnt = 0
         node = root_node
-        for step in range(self.max_steps):
+        for step in range(self.config.max_steps):
             current_state = self.config.parser(node.name)
             current_value = node.value
             thought_nodes = await self.generate_thoughts(current_state, current_node=node)
@@ -218,18 +254,133 @@ class DFSSolver(ThoughtSolverBase):
         """
         root = ThoughtNode(init_prompt)
         self.thought_tree = ThoughtTree(root)
+        self.reset_eval_cache()
         for n in range(self.config.n_solution_sample):
             # fixme: 需要产生回退，当前节点不可用时回退到父节点，产生新的节点继续探索
             await self._dfs(root)
 
         best_solution, best_solution_path = self.update_solution()
         logger.info(f"best solution is: {best_solution_path}")
+        logger.info(f"evaluation cache hit rate: {self.eval_cache_hit_rate:.2%}")
         return best_solution_path
 
 
 class MCTSSolver(ThoughtSolverBase):
+    _expanded: set = PrivateAttr(default_factory=set)
+    _expanding: set = PrivateAttr(default_factory=set)
+
     async def solve(self, init_prompt=""):
-        raise NotImplementedError
+        """
+        Solve the problem using Monte Carlo Tree Search (MCTS) strategy.
+
+        Each simulation selects a leaf by UCT, expands it with generate_thoughts and backs up the best value of the
+        evaluated children. Up to n_parallel_rollouts simulations run at the same time, a virtual loss on the path of
+        a running simulation steers the others to different paths.
+
+        Args:
+            init_prompt (str): The initial prompt for the solver.
+
+        Returns:
+            List[str]: The best solution path obtained through MCTS.
+        """
+        root = ThoughtNode(init_prompt)
+        self.thought_tree = ThoughtTree(root)
+        self.reset_eval_cache()
+        self._expanded, self._expanding = set(), set()
+        n_simulations = 0
+        while n_simulations < self.config.n_simulations:
+            paths = []
+            for _ in range(min(self.config.n_parallel_rollouts, self.config.n_simulations - n_simulations)):
+                path = self._select(root)
+                if not path:
+                    break  # every leaf left is being expanded by another rollout
+                paths.append(path)
+            if not paths:
+                break  # the whole tree is explored
+            await asyncio.gather(*(self._simulate(path) for path in paths))
+            n_simulations += len(paths)
+
+        self.thought_tree.show()
+        best_solution, best_solution_path = self.update_solution()
+        logger.info(f"best solution is: {best_solution_path}")
+        logger.info(f"evaluation cache hit rate: {self.eval_cache_hit_rate:.2%}")
+        return best_solution_path
+
+    def _select(self, root: ThoughtNode) -> List[ThoughtNode]:
+        """
+        Walk down from the root by UCT to a leaf to expand or a terminal node, applying a virtual loss on the way.
+
+        Args:
+            root (ThoughtNode): The root node of the thought tree.
+
+        Returns:
+            List[ThoughtNode]: The path from the root to the selected node, empty if no node can be selected.
+        """
+        if not self._is_selectable(root):
+            return []
+        path = [root]
+        node = root
+        while node.children:
+            parent = node
+            node = max(filter(self._is_selectable, parent.children), key=lambda child: self._uct(child, parent))
+            path.append(node)
+        for path_node in path:
+            path_node.visit_count += 1
+            path_node.total_value -= self.config.virtual_loss
+        if not self._is_terminal(node):
+            self._expanding.add(node)
+        return path
+
+    def _is_selectable(self, node: ThoughtNode) -> bool:
+        """Whether there is a leaf to expand or a terminal node to visit below the node."""
+        if node in self._expanding:
+            return False
+        if node.children:
+            return any(self._is_selectable(child) for child in node.children)
+        return self._is_terminal(node) or node not in self._expanded
+
+    def _is_terminal(self, node: ThoughtNode) -> bool:
+        return node.depth >= self.config.max_steps or node.valid_status is False
+
+    def _uct(self, node: ThoughtNode, parent: ThoughtNode) -> float:
+        if not node.visit_count:
+            return math.inf
+        exploitation = node.total_value / node.visit_count
+        exploration = math.sqrt(math.log(max(parent.visit_count, 1)) / node.visit_count)
+        return exploitation + self.config.exploration_weight * exploration
+
+    async def _simulate(self, path: List[ThoughtNode]) -> None:
+        """
+        Expand and evaluate the last node of the path, then back up the reward and revert the virtual loss.
+
+        Args:
+            path (List[ThoughtNode]): The path returned by _select.
+
+        Returns:
+            None
+        """
+        leaf = path[-1]
+        reward = 0
+        try:
+            if self._is_terminal(leaf):
+                reward = leaf.value
+            else:
+                thought_nodes = await self.generate_and_evaluate_nodes(leaf)
+                reward = max((child_node.value for child_node in thought_nodes), default=0)
+        finally:
+            self._expanding.discard(leaf)
+            for node in path:
+                node.total_value += self.config.virtual_loss + reward
+
+    async def generate_and_evaluate_nodes(self, node: ThoughtNode) -> List[ThoughtNode]:
+        thought_nodes = await self.generate_thoughts(self.config.parser(node.name), current_node=node)
+        self._expanded.add(node)
+        await asyncio.gather(*(self.evaluate_node(child_node, parent_value=node.value) for child_node in thought_nodes))
+        for child_node in thought_nodes:
+            # the evaluation is the first visit of the child
+            child_node.visit_count = 1
+            child_node.total_value = child_node.value
+        return thought_nodes
 
 
 class TreeofThought(BaseModel):
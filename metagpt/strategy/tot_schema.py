@@ -3,6 +3,7 @@
 # @Author  : stellahong (stellahong@fuzhi.ai)
 # @Desc    :
 from enum import Enum
+from typing import Callable, Optional
 
 from pydantic import BaseModel, Field
 
@@ -26,5 +27,12 @@ class ThoughtSolverConfig(BaseModel):
     n_generate_sample: int = 5  # per node
     n_select_sample: int = 3  # per path
     n_solution_sample: int = 5  # only for dfs
+    n_simulations: int = 20  # only for mcts
+    n_parallel_rollouts: int = 4  # only for mcts, the rollouts run against the llm at the same time
+    exploration_weight: float = 1.0  # only for mcts, the exploration constant of UCT
+    virtual_loss: float = 1.0  # only for mcts, keeps parallel rollouts from selecting the same path
     parser: BaseParser = Field(default_factory=BaseParser)
+    # maps a node state to the key its evaluation is cached under, equal keys are evaluated once per solve.
+    # By default the evaluation prompt with whitespace collapsed is the key.
+    canonicalizer: Optional[Callable[[str], str]] = None
     evaluator: BaseEvaluator = Field(default_factory=BaseEvaluator)
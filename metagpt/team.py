@@ -8,11 +8,12 @@
         Section 2.2.3.3 of RFC 135.
 """
 
+import uuid
 import warnings
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from metagpt.actions import UserRequirement
 from metagpt.const import MESSAGE_ROUTE_TO_ALL, SERDESER_PATH
@@ -23,11 +24,15 @@ from metagpt.roles import Role
 from metagpt.schema import Message
 from metagpt.utils.common import (
     NoMoneyException,
+    append_json_lines,
     read_json_file,
+    read_json_lines,
     serialize_decorator,
     write_json_file,
 )
 
+CHECKPOINT_COMPACT_INTERVAL = 20  # log records appended to `team.log.jsonl` before `team.json` is rewritten
+
 
 class Team(BaseModel):
     """
@@ -41,6 +46,8 @@ class Team(BaseModel):
     investment: float = Field(default=10.0)
     idea: str = Field(default="")
 
+    _checkpoint: dict = PrivateAttr(default_factory=dict)  # what the last `serialize` persisted, see `_track`
+
     def __init__(self, context: Context = None, **data: Any):
         super(Team, self).__init__(**data)
         ctx = context or Context()
@@ -53,11 +60,88 @@ class Team(BaseModel):
         if "env_desc" in data:
             self.env.desc = data["env_desc"]
 
-    def serialize(self, stg_path: Path = None):
+    def serialize(self, stg_path: Path = None, compact: bool = False):
+        """Checkpoint the team to `stg_path`.
+
+        The first call writes a full `team.json` snapshot. Later calls to the same path only append the messages and
+        role states that changed since the previous call to `team.log.jsonl`, and the snapshot is rewritten (the log
+        compacted) every `CHECKPOINT_COMPACT_INTERVAL` records, when `compact` is set, or when the change can not be
+        expressed as appended messages (e.g. a role was hired or a message was deleted from memory).
+        """
         stg_path = SERDESER_PATH.joinpath("team") if stg_path is None else stg_path
         team_info_path = stg_path.joinpath("team.json")
 
-        write_json_file(team_info_path, self.model_dump())
+        record = None
+        ckpt = self._checkpoint
+        if (
+            not compact
+            and ckpt.get("path") == stg_path
+            and ckpt["records"] < CHECKPOINT_COMPACT_INTERVAL
+            and team_info_path.exists()
+        ):
+            record = self._checkpoint_delta()
+        if record is None:
+            base = uuid.uuid4().hex
+            # The log is only replayed onto the snapshot with the same `checkpoint_id`, so a crash between the two
+            # writes below leaves a consistent checkpoint.
+            write_json_file(team_info_path, {**self.model_dump(), "checkpoint_id": base}, atomic=True)
+            stg_path.joinpath("team.log.jsonl").unlink(missing_ok=True)
+            self._track(stg_path, base)
+        elif len(record) > 1:  # something besides the snapshot id changed
+            append_json_lines(stg_path.joinpath("team.log.jsonl"), [record])
+            self._track(stg_path, ckpt["base"], records=ckpt["records"] + 1)
+
+    def _track(self, stg_path: Path, base: str, records: int = 0):
+        """Remember what has been persisted so that the next `serialize` only writes what changed since."""
+        self._checkpoint = {
+            "path": stg_path,
+            "base": base,
+            "records": records,
+            "team": self.model_dump(exclude={"env"}),
+            "env": self.env.model_dump(exclude={"roles", "history"}),
+            "roles": {k: v.model_dump(exclude={"rc": {"memory"}}) for k, v in self.env.roles.items()},
+            "memories": {k: v.rc.memory.storage[-1:] for k, v in self.env.roles.items()},
+            "memory_sizes": {k: v.rc.memory.count() for k, v in self.env.roles.items()},
+            "history": self.env.history.get(1),
+        }
+
+    def _checkpoint_delta(self) -> Optional[dict]:
+        """Diff the team against the last checkpoint, return None if a new snapshot has to be written instead."""
+        ckpt = self._checkpoint
+        if self.env.roles.keys() != ckpt["roles"].keys():
+            return None
+
+        record = {"base": ckpt["base"]}
+        team_state = self.model_dump(exclude={"env"})
+        if team_state != ckpt["team"]:
+            record["team"] = team_state
+        env_state = self.env.model_dump(exclude={"roles", "history"})
+        if env_state != ckpt["env"]:
+            record["env"] = env_state
+
+        roles, memories = {}, {}
+        for profile, role in self.env.roles.items():
+            storage = role.rc.memory.storage
+            count = ckpt["memory_sizes"][profile]
+            # Memory only appends, so a deletion moves or drops the last persisted message.
+            if len(storage) < count or storage[count - 1 : count] != ckpt["memories"][profile]:
+                return None
+            if len(storage) > count:
+                memories[profile] = [m.model_dump() for m in storage[count:]]
+            state = role.model_dump(exclude={"rc": {"memory"}})
+            if state != ckpt["roles"][profile]:
+                roles[profile] = state
+        if roles:
+            record["roles"] = roles
+        if memories:
+            record["memories"] = memories
+
+        new_msgs = _new_messages(self.env.history.storage, ckpt["history"])
+        if new_msgs is None:
+            return None
+        if new_msgs:
+            record["history"] = [m.model_dump() for m in new_msgs]
+        return record
 
     @classmethod
     def deserialize(cls, stg_path: Path, context: Context = None) -> "Team":
@@ -70,6 +154,11 @@ class Team(BaseModel):
             )
 
         team_info: dict = read_json_file(team_info_path)
+        base = team_info.pop("checkpoint_id", None)
+        if base:
+            for record in read_json_lines(stg_path.joinpath("team.log.jsonl")):
+                if record.get("base") == base:
+                    _replay(team_info, record)
         ctx = context or Context()
         team = Team(**team_info, context=ctx)
         return team
@@ -126,6 +215,9 @@ class Team(BaseModel):
             self.run_project(idea=idea, send_to=send_to)
 
         while n_round > 0:
+            if self.env.is_idle:
+                logger.debug("All roles are idle.")
+                break
             # self._save()
             n_round -= 1
             logger.debug(f"max {n_round=} left.")
@@ -133,4 +225,35 @@ class Team(BaseModel):
 
             await self.env.run()
         self.env.archive(auto_archive)
-        return self.env.history
+        return self.env.history.render()
+
+
+def _new_messages(storage, persisted: list[Message]) -> Optional[list[Message]]:
+    """Return the messages appended to the bounded `storage` after `persisted` (the last persisted message, if any),
+    or None if that message has already been evicted."""
+    if not persisted:
+        return list(storage)
+    new_msgs = []
+    for msg in reversed(storage):
+        if msg is persisted[0]:
+            return new_msgs[::-1]
+        new_msgs.append(msg)
+    return None
+
+
+def _replay(team_info: dict, record: dict):
+    """Apply one `team.log.jsonl` record to the `team.json` snapshot."""
+    team_info.update(record.get("team", {}))
+    env_info = team_info["env"]
+    env_info.update(record.get("env", {}))
+    roles = env_info["roles"]
+    for profile, state in record.get("roles", {}).items():
+        state["rc"]["memory"] = roles[profile]["rc"]["memory"]
+        roles[profile] = state
+    for profile, msgs in record.get("memories", {}).items():
+        memory = roles[profile]["rc"]["memory"]
+        memory["storage"].extend(msgs)
+        for msg in msgs:
+            if msg["cause_by"]:
+                memory["index"].setdefault(msg["cause_by"], []).append(msg["id"])
+    env_info["history"]["storage"].extend(record.get("history", []))
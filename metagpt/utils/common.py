@@ -572,13 +572,53 @@ def read_json_file(json_file: str, encoding="utf-8") -> list[Any]:
     return data
 
 
-def write_json_file(json_file: str, data: list, encoding: str = None, indent: int = 4):
+def write_json_file(json_file: str, data: list, encoding: str = None, indent: int = 4, atomic: bool = False):
+    """Write `data` as json. With `atomic`, the file is written to a temporary sibling, fsynced and renamed over
+    `json_file`, so readers see either the old or the new content, never a partial write."""
     folder_path = Path(json_file).parent
     if not folder_path.exists():
         folder_path.mkdir(parents=True, exist_ok=True)
 
-    with open(json_file, "w", encoding=encoding) as fout:
+    if not atomic:
+        with open(json_file, "w", encoding=encoding) as fout:
+            json.dump(data, fout, ensure_ascii=False, indent=indent, default=to_jsonable_python)
+        return
+
+    tmp_file = Path(f"{json_file}.tmp")
+    with open(tmp_file, "w", encoding=encoding) as fout:
         json.dump(data, fout, ensure_ascii=False, indent=indent, default=to_jsonable_python)
+        fout.flush()
+        os.fsync(fout.fileno())
+    os.replace(tmp_file, json_file)
+
+
+def read_json_lines(jsonl_file: str, encoding="utf-8") -> list[Any]:
+    """Read a JSON Lines file, return [] if it does not exist. A truncated last line, as left by a crash in the middle
+    of `append_json_lines`, is skipped."""
+    if not Path(jsonl_file).exists():
+        return []
+
+    data = []
+    with open(jsonl_file, "r", encoding=encoding) as fin:
+        for line in fin:
+            try:
+                data.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"skip broken line in {jsonl_file}: {line[:100]}")
+    return data
+
+
+def append_json_lines(jsonl_file: str, data: list, encoding: str = "utf-8"):
+    """Append each item of `data` as one line of `jsonl_file` and fsync it."""
+    folder_path = Path(jsonl_file).parent
+    if not folder_path.exists():
+        folder_path.mkdir(parents=True, exist_ok=True)
+
+    with open(jsonl_file, "a", encoding=encoding) as fout:
+        for item in data:
+            fout.write(json.dumps(item, ensure_ascii=False, default=to_jsonable_python) + "\n")
+        fout.flush()
+        os.fsync(fout.fileno())
 
 
 def read_csv_to_list(curr_file: str, header=False, strip_trail=True):
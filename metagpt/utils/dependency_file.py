@@ -8,6 +8,7 @@
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from pathlib import Path
@@ -30,6 +31,7 @@ class DependencyFile:
         """
         self._dependencies = {}
         self._filename = Path(workdir) / ".dependencies.json"
+        self._lock = None  # serializes the load-modify-save of concurrent updates
 
     async def load(self):
         """Load dependencies from the file asynchronously."""
@@ -52,6 +54,10 @@ class DependencyFile:
         :param dependencies: The set of dependencies.
         :param persist: Whether to persist the changes immediately.
         """
+        async with self._get_lock():
+            await self._update(filename=filename, dependencies=dependencies, persist=persist)
+
+    async def _update(self, filename: Path | str, dependencies: Set[Path | str], persist=True):
         if persist:
             await self.load()
 
@@ -85,7 +91,8 @@ class DependencyFile:
         :return: A set of dependencies.
         """
         if persist:
-            await self.load()
+            async with self._get_lock():
+                await self.load()
 
         root = self._filename.parent
         try:
@@ -94,6 +101,11 @@ class DependencyFile:
             key = filename
         return set(self._dependencies.get(str(key), {}))
 
+    def _get_lock(self) -> asyncio.Lock:
+        if not self._lock:
+            self._lock = asyncio.Lock()  # created lazily in the running event loop
+        return self._lock
+
     def delete_file(self):
         """Delete the dependency file."""
         self._filename.unlink(missing_ok=True)
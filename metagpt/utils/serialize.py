@@ -4,6 +4,7 @@
 
 import copy
 import pickle
+import weakref
 
 from metagpt.utils.common import import_class
 
@@ -57,6 +58,34 @@ def actionoutput_str_to_mapping(mapping: dict) -> dict:
     return new_mapping
 
 
+# instruct_content class -> {"class": ..., "mapping": ...} or {"class": ..., "module": ...}, shared by `Message`
+# serialization. Weakly keyed, so that classes dropped from the `action_outcls_registry` are not kept alive.
+_ic_meta_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_instruct_content_meta(ic_cls: type) -> dict:
+    """Return the class description written alongside an instruct_content value, computing its schema only once."""
+    meta = _ic_meta_cache.get(ic_cls)
+    if meta is None:
+        schema = ic_cls.model_json_schema()
+        if "<class 'metagpt.actions.action_node" in str(ic_cls):
+            # instruct_content from AutoNode.create_model_class, for now, it's single level structure.
+            mapping = actionoutput_mapping_to_str(actionoutout_schema_to_mapping(schema))
+            meta = {"class": schema["title"], "mapping": mapping}
+        else:
+            # due to instruct_content can be assigned by subclasses of BaseModel
+            meta = {"class": schema["title"], "module": ic_cls.__module__}
+        _ic_meta_cache[ic_cls] = meta
+    return meta
+
+
+def get_instruct_content_class(class_name: str, mapping: dict) -> type:
+    """Return the instruct_content class for a serialized str mapping, the same class for the same class name and
+    mapping as long as it stays in the `action_outcls_registry` of `ActionNode.create_model_class`."""
+    actionnode_class = import_class("ActionNode", "metagpt.actions.action_node")  # avoid circular import
+    return actionnode_class.create_model_class(class_name=class_name, mapping=actionoutput_str_to_mapping(mapping))
+
+
 def serialize_message(message: "Message"):
     message_cp = copy.deepcopy(message)  # avoid `instruct_content` value update by reference
     ic = message_cp.instruct_content
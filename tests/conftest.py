@@ -25,6 +25,7 @@ from metagpt.logs import logger
 from metagpt.utils.git_repository import GitRepository
 from metagpt.utils.project_repo import ProjectRepo
 from tests.mock.mock_aiohttp import MockAioResponse
+from tests.mock.mock_concurrency import ConcurrencyProbe
 from tests.mock.mock_curl_cffi import MockCurlCffiResponse
 from tests.mock.mock_httplib2 import MockHttplib2Response
 from tests.mock.mock_llm import MockLLM
@@ -280,3 +281,9 @@ def git_dir():
     git_dir = Path(__file__).parent / f"unittest/{uuid.uuid4().hex}"
     git_dir.mkdir(parents=True, exist_ok=True)
     return git_dir
+
+
+@pytest.fixture
+def concurrency_probe():
+    """Fixture to measure the peak concurrency of mocked coroutines, see `ConcurrencyProbe`."""
+    return ConcurrencyProbe()
@@ -15,6 +15,7 @@ from metagpt.actions import Action
 from metagpt.actions.action_node import ActionNode, ReviewMode, ReviseMode
 from metagpt.environment import Environment
 from metagpt.llm import LLM
+from metagpt.logs import log_llm_stream
 from metagpt.roles import Role
 from metagpt.schema import Message
 from metagpt.team import Team
@@ -81,6 +82,41 @@ async def test_action_node_one_layer():
     assert "key-a" in repr(node)
 
 
+def test_action_node_compile_cache(mocker):
+    node_a = ActionNode(key="reasoning", expected_type=str, instruction="reasoning step by step", example="")
+    node_b = ActionNode(key="answer", expected_type=str, instruction="the final answer", example="579")
+    root = ActionNode.from_children(key="detail answer", nodes=[node_a, node_b])
+    spy = mocker.spy(root, "compile_example")
+
+    prompt = root.compile(context="123+456?", schema="json", mode="auto")
+    assert root.compile(context="123+456=?", schema="json", mode="auto") == prompt.replace("123+456?", "123+456=?")
+    assert spy.call_count == 1
+
+    node_b.example = "five hundred seventy-nine"
+    prompt = root.compile(context="123+456?", schema="json", mode="auto")
+    assert spy.call_count == 2
+    assert "five hundred seventy-nine" in prompt
+    root.compile(context="123+456?", schema="json", mode="auto", exclude=["answer"])
+    assert spy.call_count == 3
+
+    node_b.example = ["579"]
+    root.compile(context="123+456?", schema="json", mode="auto")
+    node_b.example.append("five hundred seventy-nine")  # changed in place
+    prompt = root.compile(context="123+456?", schema="json", mode="auto")
+    assert spy.call_count == 5
+    assert "five hundred seventy-nine" in prompt
+
+
+def test_action_node_compile_static_prefix():
+    node = ActionNode(key="answer", expected_type=str, instruction="the final answer", example="579")
+    prompt = node.compile(context="123+456?", schema="json", mode="auto")
+    other_prompt = node.compile(context="1+1?", schema="json", mode="auto")
+
+    prefix = prompt[: prompt.index("123+456?")]
+    assert other_prompt.startswith(prefix)
+    assert "## format example" in prefix and "## constraint" in prefix
+
+
 @pytest.mark.asyncio
 async def test_action_node_two_layer():
     node_a = ActionNode(key="reasoning", expected_type=str, instruction="reasoning step by step", example="")
@@ -98,6 +134,65 @@ async def test_action_node_two_layer():
     assert "579" in answer2.content
 
 
+@pytest.mark.asyncio
+async def test_action_node_complex_fill_concurrently(mocker, concurrency_probe):
+    nodes = [ActionNode(key=f"field{i}", expected_type=str, instruction="", example="") for i in range(4)]
+    root = ActionNode.from_children(key="root", nodes=nodes)
+
+    async def simple_fill(self, **kwargs):
+        await concurrency_probe.run()
+        self.instruct_content = self.create_class(mode="root")(**{self.key: f"{self.key} value"})
+        return self
+
+    mocker.patch.object(ActionNode, "simple_fill", simple_fill)
+    await root.fill(context="", llm=None, strgy="complex", max_concurrency=2, exclude=["field3"])
+    assert concurrency_probe.peak == 2
+    assert root.instruct_content.model_dump() == {f"field{i}": f"field{i} value" for i in range(3)}
+
+
+@pytest.mark.asyncio
+async def test_action_node_fill_field_callback(mocker):
+    nodes = [
+        ActionNode(key="Language", expected_type=str, instruction="", example=""),
+        ActionNode(key="Task list", expected_type=List[str], instruction="", example=[]),
+    ]
+    root = ActionNode.from_children(key="root", nodes=nodes)
+    output = '[CONTENT]\n{"Language": "en_us", "Task list": ["main.py", "game.py"]}\n[/CONTENT]'
+    events = []
+
+    async def aask(*args, stream=False, **kwargs):
+        assert stream
+        for idx in range(0, len(output), 7):
+            events.append("chunk")
+            log_llm_stream(output[idx : idx + 7])
+        return output
+
+    llm = LLM()
+    mocker.patch.object(llm, "aask", aask)
+    fields = []
+
+    def on_field(key, value):
+        events.append(key)
+        fields.append((key, value))
+
+    await root.fill(context="", llm=llm, field_callback=on_field)
+    assert fields == [("Language", "en_us"), ("Task list", ["main.py", "game.py"])]
+    assert "chunk" in events[events.index("Language") :]  # reported before the output is finished
+    assert root.instruct_content.model_dump() == dict(fields)
+
+    # an LLM that does not stream its output reports the fields once it is complete
+    async def aask_without_stream(*args, **kwargs):
+        return output
+
+    mocker.patch.object(llm, "aask", aask_without_stream)
+    fields.clear()
+    await root.fill(context="", llm=llm, field_callback=on_field)
+    assert fields == [("Language", "en_us"), ("Task list", ["main.py", "game.py"])]
+
+    with pytest.raises(ValueError):
+        await root.fill(context="", llm=llm, schema="markdown", field_callback=on_field)
+
+
 @pytest.mark.asyncio
 async def test_action_node_review():
     key = "Project Name"
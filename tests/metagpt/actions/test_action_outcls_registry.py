@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 # @Desc   : unittest of action_outcls_registry
 
+from collections import OrderedDict
 from typing import List
 
 from metagpt.actions.action_node import ActionNode
@@ -44,3 +45,16 @@ def test_action_outcls_registry():
     outcls6 = ActionNode.create_model_class(class_name, out_mapping)
     outinst6 = outcls6(**out_data2)
     assert outinst5 == outinst6
+
+
+def test_action_outcls_registry_lru(mocker):
+    mocker.patch("metagpt.actions.action_outcls_registry.ACTION_OUTCLS_REGISTRY_MAXSIZE", 2)
+    mocker.patch("metagpt.actions.action_outcls_registry.action_outcls_registry", OrderedDict())
+    mapping = {"field": (str, ...)}
+
+    outcls_a = ActionNode.create_model_class("lru_a", mapping)
+    outcls_b = ActionNode.create_model_class("lru_b", mapping)
+    assert ActionNode.create_model_class("lru_a", mapping) is outcls_a  # `lru_a` becomes the most recently used
+    ActionNode.create_model_class("lru_c", mapping)  # evicts `lru_b`
+    assert ActionNode.create_model_class("lru_a", mapping) is outcls_a
+    assert ActionNode.create_model_class("lru_b", mapping) is not outcls_b
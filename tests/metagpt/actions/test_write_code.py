@@ -7,11 +7,13 @@
 @Modifiled By: mashenquan, 2023-12-6. According to RFC 135
 """
 import json
+import os
 from pathlib import Path
 
 import pytest
 
-from metagpt.actions.write_code import WriteCode
+import metagpt.actions.write_code
+from metagpt.actions.write_code import CodeContext, WriteCode
 from metagpt.logs import logger
 from metagpt.schema import CodingContext, Document
 from metagpt.utils.common import CodeParser, aread
@@ -159,5 +161,38 @@ async def test_get_codes(context):
     assert codes_inc
 
 
+@pytest.mark.asyncio
+async def test_get_codes_with_code_context(context, mocker):
+    context.src_workspace = context.git_repo.workdir / "src"
+    project_repo = context.repo.with_src_path(context.src_workspace)
+    filenames = ["game.py", "ui.py", "main.py"]
+    for filename in filenames:
+        await project_repo.srcs.save(filename=filename, content=f"# {filename}\ncode ...")
+    task_doc = Document(filename="1.json", content=json.dumps({"Task list": filenames}))
+    spy = mocker.spy(metagpt.actions.write_code, "aread")
+
+    code_context = CodeContext()
+    codes = await WriteCode.get_codes(task_doc, exclude="main.py", project_repo=project_repo, code_context=code_context)
+    assert codes == await WriteCode.get_codes(task_doc, exclude="main.py", project_repo=project_repo)
+    assert spy.call_count == 4  # 2 files read once for the code context, 2 for the call without it
+
+    # only a file changed on disk is read again, a file written through the code context is not read at all
+    await project_repo.srcs.save(filename="game.py", content="# game.py\nnew code ...")
+    await project_repo.srcs.save(filename="main.py", content="# main.py\nnew code ...")
+    code_context.update(project_repo.srcs, "main.py", "# main.py\nnew code ...")
+    codes = await WriteCode.get_codes(task_doc, exclude="ui.py", project_repo=project_repo, code_context=code_context)
+    assert "# game.py\nnew code ..." in codes
+    assert "# main.py\nnew code ..." in codes
+    assert spy.call_count == 5
+
+    # a change within the resolution of the file system's modification time is caught by the file size
+    pathname = project_repo.srcs.workdir / "game.py"
+    st = pathname.stat()
+    await project_repo.srcs.save(filename="game.py", content="# game.py\nnewer code ...")
+    os.utime(pathname, ns=(st.st_atime_ns, st.st_mtime_ns))
+    codes = await WriteCode.get_codes(task_doc, exclude="ui.py", project_repo=project_repo, code_context=code_context)
+    assert "# game.py\nnewer code ..." in codes
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-s"])
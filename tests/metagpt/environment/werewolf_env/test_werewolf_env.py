@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @Desc   : the unittest of WerewolfEnv
+
+from metagpt.environment.werewolf_env.werewolf_env import WerewolfEnv
+from metagpt.memory import Memory
+from metagpt.roles.role import Role
+from metagpt.schema import Message
+
+
+class Moderator(Role):
+    profile: str = "Moderator"
+
+
+class Villager(Role):
+    profile: str = "Villager"
+
+
+def test_werewolf_env_publish_message(mocker):
+    mocker.patch.object(WerewolfEnv, "memory", Memory(), create=True)  # the shared memory of the game
+    env = WerewolfEnv()
+    env.add_roles([Moderator(), Villager()])
+    assert env.is_idle
+
+    env.publish_message(Message(content="It's dark, everyone close your eyes."))
+    assert env.memory.get()[-1].content == "0 | It's dark, everyone close your eyes."
+    assert not env.is_idle  # every role observes the shared memory, so the team keeps running
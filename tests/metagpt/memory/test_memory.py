@@ -55,3 +55,25 @@ def test_memory():
     memory.clear()
     assert memory.count() == 0
     assert len(memory.index) == 0
+
+
+def test_memory_positions():
+    memory = Memory()
+    messages = [Message(content=f"test message{i}") for i in range(5)]
+    memory.add_batch(messages + messages[:2])
+    assert memory.count() == 5
+
+    memory.delete(messages[1])
+    assert memory.storage == [messages[0], *messages[2:]]
+    assert memory.contains(messages[4])
+    assert not memory.contains(messages[1])
+    memory.delete(messages[4])
+    assert memory.delete_newest() == messages[3]
+    assert memory.storage == [messages[0], messages[2]]
+
+    assert memory.find_news(messages) == [messages[1], messages[3], messages[4]]
+    assert memory.find_news(messages, k=1) == [messages[0], messages[1], messages[3], messages[4]]
+
+    new_memory = Memory(**memory.model_dump())
+    assert new_memory.contains(messages[2])
+    assert new_memory.find_news(messages) == [messages[1], messages[3], messages[4]]
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @Desc   :
+
+from metagpt.provider.postprocess.stream_json_parser import StreamJsonParser
+
+raw_output = """[CONTENT]
+{
+    "Language": "en_us",
+    "Requirement Pool": [["P0", "a {nested}, \\"quoted\\" item"], ["P1", "b"]],
+    "Anything UNCLEAR": 'single quoted',
+    "Score": 1.5,
+    "Done": true
+}
+[/CONTENT]"""
+
+expected_fields = [
+    ("Language", "en_us"),
+    ("Requirement Pool", [["P0", 'a {nested}, "quoted" item'], ["P1", "b"]]),
+    ("Anything UNCLEAR", "single quoted"),
+    ("Score", 1.5),
+    ("Done", True),
+]
+
+
+def test_stream_json_parser():
+    parser = StreamJsonParser()
+    assert parser.feed(raw_output) == expected_fields
+    assert parser.feed('{"Other": 1}') == []
+
+
+def test_stream_json_parser_char_by_char():
+    parser = StreamJsonParser()
+    fields = []
+    for idx, char in enumerate(raw_output):
+        new_fields = parser.feed(char)
+        if new_fields:
+            # a field is reported by the chunk closing its value, not later
+            assert raw_output[idx] in ",}"
+        fields.extend(new_fields)
+    assert fields == expected_fields
+
+
+def test_stream_json_parser_undecodable_value():
+    parser = StreamJsonParser()
+    assert parser.feed('{"Code": print(1), "Next": ') == [("Code", "print(1)")]
+    assert parser.feed('"x"}') == [("Next", "x")]
@@ -1,7 +1,11 @@
 import pytest
 
+from metagpt.actions.di.execute_nb_code import ExecuteNbCode
+from metagpt.actions.di.write_analysis_code import WriteAnalysisCode
 from metagpt.logs import logger
 from metagpt.roles.di.data_interpreter import DataInterpreter
+from metagpt.schema import Plan, Task
+from metagpt.strategy.planner import Planner
 
 
 @pytest.mark.asyncio
@@ -32,3 +36,46 @@ async def test_interpreter_react_mode(mocker):
     rsp = await di.run(requirement)
     logger.info(rsp)
     assert len(rsp.content) > 0
+
+
+@pytest.mark.asyncio
+async def test_interpreter_concurrent_tasks(mocker, concurrency_probe):
+    tasks = [
+        Task(task_id="1", instruction="load data", task_type="other"),
+        Task(task_id="2", instruction="plot data", task_type="other", dependent_task_ids=["1"]),
+        Task(task_id="3", instruction="describe data", task_type="other", dependent_task_ids=["1"]),
+        Task(task_id="4", instruction="write report", task_type="other", dependent_task_ids=["2", "3"]),
+    ]
+
+    async def update_plan(self, goal="", **kwargs):
+        self.plan = Plan(goal=goal)
+        self.plan.add_tasks([task.model_copy() for task in tasks])
+
+    async def write_code(self, plan_status="", **kwargs):
+        await concurrency_probe.run()
+        current_task = plan_status.split("## Current Task")[1]
+        return next(f"code of {task.task_id}" for task in tasks if task.instruction in current_task)
+
+    executed = []
+
+    async def run(self, code, **kwargs):
+        executed.append((id(self), code))
+        return "a successful run", True
+
+    mocker.patch.object(Planner, "update_plan", update_plan)
+    mocker.patch.object(WriteAnalysisCode, "run", write_code)
+    mocker.patch.object(ExecuteNbCode, "run", run)
+
+    di = DataInterpreter(max_concurrent_tasks=2)
+    await di.run("analyze the data")
+
+    assert concurrency_probe.peak == 2
+    finished_tasks = di.planner.plan.get_finished_tasks()
+    assert [(task.task_id, task.code) for task in finished_tasks] == [(i, f"code of {i}") for i in "1234"]
+    # lone ready tasks run in the main kernel, which catches up on the tasks finished by workers first
+    main_kernel = id(di.execute_code)
+    assert [code for kernel, code in executed if kernel == main_kernel] == [f"code of {i}" for i in "1234"]
+    # a worker kernel replays the code of its task's dependencies first
+    kernel_of_2 = next(kernel for kernel, code in executed if code == "code of 2")
+    assert kernel_of_2 != main_kernel
+    assert [code for kernel, code in executed if kernel == kernel_of_2] == ["code of 1", "code of 2"]
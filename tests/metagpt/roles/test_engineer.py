@@ -16,7 +16,7 @@ from metagpt.actions import WriteCode, WriteTasks
 from metagpt.const import REQUIREMENT_FILENAME, SYSTEM_DESIGN_FILE_REPO, TASK_FILE_REPO
 from metagpt.logs import logger
 from metagpt.roles.engineer import Engineer
-from metagpt.schema import CodingContext, Message
+from metagpt.schema import CodingContext, Document, Message
 from metagpt.utils.common import CodeParser, any_to_name, any_to_str, aread, awrite
 from metagpt.utils.git_repository import ChangeType
 from tests.metagpt.roles.mock import STRS_FOR_PARSING, TASKS, MockMessages
@@ -147,5 +147,80 @@ async def test_new_coding_context(context):
         context.git_repo.delete_repository()
 
 
+@pytest.mark.asyncio
+async def test_write_code_concurrently(mocker, concurrency_probe):
+    logic_analysis = [
+        ["game.py", "Contains Game class"],
+        ["ui.py", "Contains UI class"],
+        ["main.py", "Contains main function, from game import Game, from ui import UI"],
+    ]
+    task_list = ["game.py", "ui.py", "main.py"]
+    task_doc = Document(
+        filename="tasks.json", content=json.dumps({"Logic Analysis": logic_analysis, "Task list": task_list})
+    )
+    filenames = task_list + ["readme.py"]  # readme.py is not analysed, so it goes last
+    engineer = Engineer(n_borg=2, concurrent_coding=True)
+    engineer.code_todos = [
+        WriteCode(
+            i_context=Document(filename=i, content=CodingContext(filename=i, task_doc=task_doc).model_dump_json())
+        )
+        for i in filenames
+    ]
+    events = []
+
+    async def write_code_todo(todo, review=False):
+        events.append(f"start {todo.i_context.filename}")
+        await concurrency_probe.run()
+        events.append(f"end {todo.i_context.filename}")
+        return todo.i_context.filename
+
+    mocker.patch.object(engineer, "_write_code_todo", write_code_todo)
+    changed_files = await engineer._act_sp_with_cr()
+
+    assert changed_files == set(filenames)
+    assert concurrency_probe.peak == 2
+    assert events.index("start main.py") > max(events.index("end game.py"), events.index("end ui.py"))
+    assert events.index("start readme.py") > events.index("end main.py")
+
+    # without concurrent_coding, files are written one at a time whatever n_borg is
+    engineer.concurrent_coding = False
+    events.clear()
+    await engineer._act_sp_with_cr()
+    assert events == [f"{event} {i}" for i in filenames for event in ["start", "end"]]
+
+    # a failing writer cancels the others before the error is raised
+    async def failing_write_code_todo(todo, review=False):
+        if todo.i_context.filename == "game.py":
+            raise ValueError("game.py")
+        return await write_code_todo(todo, review)
+
+    mocker.patch.object(engineer, "_write_code_todo", failing_write_code_todo)
+    engineer.concurrent_coding = True
+    events.clear()
+    with pytest.raises(ValueError):
+        await engineer._act_sp_with_cr()
+    assert events == ["start ui.py"]
+
+
+def test_get_code_todo_dependencies():
+    def todo(filename, task_content):
+        task_doc = Document(filename="tasks.json", content=task_content)
+        coding_context = CodingContext(filename=filename, task_doc=task_doc)
+        return WriteCode(i_context=Document(filename=filename, content=coding_context.model_dump_json()))
+
+    task = {
+        "Task list": ["game.py", "game_view.py", "main.py"],
+        "Logic Analysis": [["game_view.py", "Contains GameView"], ["main.py", "Runs game_view.GameView"]],
+    }
+    engineer = Engineer()
+    engineer.code_todos = [todo(i, json.dumps(task)) for i in task["Task list"]]
+    dependencies = engineer._get_code_todo_dependencies()
+    assert dependencies["game_view.py"] == set()
+    assert dependencies["main.py"] == {"game_view.py"}  # "game" is only part of the name "game_view"
+
+    engineer.code_todos.append(todo("cli.py", "not a json"))
+    assert engineer._get_code_todo_dependencies()["cli.py"] == set(task["Task list"])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-s"])
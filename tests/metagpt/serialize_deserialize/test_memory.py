@@ -64,3 +64,25 @@ def test_memory_serdeser_save(context):
     assert new_msg2.instruct_content.field1 == ["field1 value1", "field1 value2"]
     assert new_msg2.cause_by == any_to_str(WriteDesign)
     assert len(new_memory.index) == 2
+
+
+def test_memory_index_serdeser(context):
+    msg1 = Message(role="User", content="write a 2048 game", cause_by=UserRequirement)
+    msg2 = Message(role="Architect", content="system design content", cause_by=WriteDesign)
+    msg3 = Message(role="Architect", content="system design update", cause_by=WriteDesign)
+    memory = Memory()
+    memory.add_batch([msg1, msg2, msg3])
+
+    ser_data = memory.model_dump()
+    assert ser_data["index"] == {msg1.cause_by: [msg1.id], msg2.cause_by: [msg2.id, msg3.id]}
+
+    new_memory = Memory(**ser_data)
+    assert new_memory.get_by_action(WriteDesign) == [msg2, msg3]
+    assert new_memory.get_by_action(WriteDesign)[1] is new_memory.storage[2]
+
+    # checkpoints written before the index was stored as ids
+    ser_data["index"] = {k: [m.model_dump() for m in v] for k, v in memory.index.items()}
+    new_memory = Memory(**ser_data)
+    assert new_memory.get_by_action(UserRequirement)[0] is new_memory.storage[0]
+    new_memory.delete(new_memory.storage[1])
+    assert new_memory.get_by_action(WriteDesign) == [msg3]
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 # @Desc   : unittest of polymorphic conditions
 import copy
+import sys
 
 from pydantic import BaseModel, ConfigDict, SerializeAsAny
 
@@ -61,3 +62,18 @@ def test_polymorphic():
     new_action_subcls = ActionSubClasses.model_validate(action_subcls_dict2)
     assert isinstance(new_action_subcls.actions[0], ActionOKV2)
     assert isinstance(new_action_subcls.actions[1], ActionPass)
+
+
+def test_polymorphic_import_unregistered(monkeypatch):
+    from metagpt.actions.generate_questions import GenerateQuestions
+
+    action_subcls_dict = ActionSubClasses(actions=[GenerateQuestions()]).model_dump()
+    class_full_name = action_subcls_dict["actions"][0]["__module_class_name"]
+    assert Action.get_registered_class(class_full_name) is GenerateQuestions
+
+    # as if the checkpoint were loaded by a process that has not imported the module yet
+    monkeypatch.delitem(sys.modules, GenerateQuestions.__module__)
+    monkeypatch.delitem(Action.__subclasses_map__, class_full_name)
+    new_action_subcls = ActionSubClasses(**action_subcls_dict)
+    assert type(new_action_subcls.actions[0]).__name__ == "GenerateQuestions"
+    assert sys.modules[GenerateQuestions.__module__]
@@ -8,10 +8,12 @@ from pathlib import Path
 
 import pytest
 
+from metagpt.actions import UserRequirement
 from metagpt.logs import logger
 from metagpt.roles import Architect, ProductManager, ProjectManager
+from metagpt.schema import Message
 from metagpt.team import Team
-from metagpt.utils.common import write_json_file
+from metagpt.utils.common import read_json_lines, write_json_file
 from tests.metagpt.serialize_deserialize.test_serdeser_base import (
     ActionOK,
     RoleA,
@@ -68,6 +70,42 @@ def test_team_serdeser_save(mocker, context):
     assert len(new_company.env.roles) == 1
 
 
+def test_team_incremental_checkpoint(context):
+    stg_path = serdeser_path.joinpath("team")
+    shutil.rmtree(stg_path, ignore_errors=True)
+    log_path = stg_path.joinpath("team.log.jsonl")
+
+    company = Team(context=context)
+    role_c = RoleC()
+    company.hire([role_c])
+    company.serialize(stg_path=stg_path)
+    assert stg_path.joinpath("team.json").exists()
+    assert not log_path.exists()
+
+    company.serialize(stg_path=stg_path)  # nothing changed
+    assert not log_path.exists()
+
+    for i in range(3):
+        msg = Message(content=f"msg {i}", cause_by=UserRequirement)
+        company.env.publish_message(msg)
+        role_c.rc.memory.add(msg)
+        company.invest(i + 1)
+        company.serialize(stg_path=stg_path)
+    assert len(read_json_lines(log_path)) == 3
+
+    new_company = Team.deserialize(stg_path)
+    assert new_company.investment == 3
+    assert new_company.env.history.get() == company.env.history.get()
+    new_role_c = new_company.env.get_role(role_c.profile)
+    assert new_role_c.rc.memory.storage == role_c.rc.memory.storage
+    assert len(new_role_c.rc.memory.get_by_action(UserRequirement)) == 3
+
+    role_c.rc.memory.delete_newest()  # not an append, so a new snapshot is written
+    company.serialize(stg_path=stg_path)
+    assert not log_path.exists()
+    assert Team.deserialize(stg_path).env.get_role(role_c.profile).rc.memory.count() == 2
+
+
 @pytest.mark.asyncio
 async def test_team_recover(mocker, context):
     mocker.patch("metagpt.team.Team.serialize", mock_team_serialize)
@@ -1,4 +1,6 @@
-from metagpt.schema import Plan, Task
+import pytest
+
+from metagpt.schema import Plan, Task, TaskResult
 from metagpt.strategy.planner import Planner
 from metagpt.strategy.task_type import TaskType
 
@@ -35,3 +37,31 @@ def test_planner_get_plan_status():
     assert "some finished test result" in status
     assert "test instruction for current task" in status
     assert TaskType.DATA_PREPROCESS.value.guidance in status  # current task guidance
+
+
+@pytest.mark.asyncio
+async def test_planner_process_task_result_of_another_task(mocker):
+    tasks = [Task(task_id="1"), Task(task_id="2", dependent_task_ids=["1"]), Task(task_id="3", dependent_task_ids=["1"])]
+    planner = Planner(goal="test goal")
+    planner.plan.add_tasks(tasks)
+    planner.plan.finish_task("1")
+    reviewed, updated = [], []
+
+    async def ask_review(self, task_result=None, **kwargs):
+        reviewed.append(self.current_task_id)
+        return ("confirm", True) if task_result.is_success else ("change task 3", False)
+
+    async def update_plan(self, **kwargs):
+        updated.append(self.current_task_id)
+
+    mocker.patch.object(Planner, "ask_review", ask_review)
+    mocker.patch.object(Planner, "update_plan", update_plan)
+
+    await planner.process_task_result(TaskResult(code="", result="", is_success=False), task=planner.plan.task_map["3"])
+    assert reviewed == updated == ["3"]
+    assert planner.current_task_id == "2"
+
+    await planner.process_task_result(TaskResult(code="3", result="", is_success=True), task=planner.plan.task_map["3"])
+    assert planner.plan.task_map["3"].is_finished and planner.plan.task_map["3"].code == "3"
+    assert not planner.plan.task_map["2"].is_finished
+    assert planner.current_task_id == "2"
@@ -8,6 +8,7 @@
 import pytest
 
 from metagpt.actions.action_graph import ActionGraph
+from metagpt.actions.action_node import ActionNode
 from metagpt.llm import LLM
 from metagpt.strategy.search_space import SearchSpace
 from metagpt.strategy.solver import NaiveSolver
@@ -45,3 +46,49 @@ async def test_solver():
     assert len(graph.nodes) == 4
     assert len(graph.execution_order) == 4
     assert graph.execution_order == [ISSUE_TYPE.key, PRODUCT_GOALS.key, COMPETITIVE_ANALYSIS.key, REQUIREMENT_POOL.key]
+
+
+@pytest.mark.asyncio
+async def test_naive_solver_runs_ready_nodes_concurrently(mocker, concurrency_probe):
+    nodes = [ActionNode(key=key, expected_type=str, instruction="", example="") for key in ["a", "b", "c", "d"]]
+    graph = ActionGraph()
+    for node in nodes:
+        graph.add_node(node)
+    # a -> b, a -> c, (b, c) -> d
+    graph.add_edge(nodes[0], nodes[1])
+    graph.add_edge(nodes[0], nodes[2])
+    graph.add_edge(nodes[1], nodes[3])
+    graph.add_edge(nodes[2], nodes[3])
+    contexts = {}
+
+    async def fill(self, context, llm, **kwargs):
+        contexts[self.key] = context
+        await concurrency_probe.run()
+        self.instruct_content = self.create_class(mode="root")(**{self.key: f"{self.key} output"})
+        return self
+
+    mocker.patch.object(ActionNode, "fill", fill)
+    await NaiveSolver(graph, SearchSpace(), None, "ctx").solve()
+
+    assert concurrency_probe.peak == 2
+    assert contexts["a"] == "ctx"
+    assert contexts["b"] == "ctx\n\n## a\na output"
+    assert graph.execution_order == ["a", "c", "b", "d"]
+    assert contexts["d"] == "ctx\n\n## c\nc output\n\n## b\nb output"
+
+
+@pytest.mark.asyncio
+async def test_naive_solver_checks_graph():
+    nodes = [ActionNode(key=key, expected_type=str, instruction="", example="") for key in ["a", "b", "c"]]
+    graph = ActionGraph()
+    for node in nodes[:2]:
+        graph.add_node(node)
+    graph.add_edge(nodes[0], nodes[2])
+    with pytest.raises(ValueError, match="not nodes"):
+        await NaiveSolver(graph, SearchSpace(), None, "ctx").solve()
+
+    graph.add_node(nodes[2])
+    graph.add_edge(nodes[2], nodes[1])
+    graph.add_edge(nodes[1], nodes[2])
+    with pytest.raises(ValueError, match=r"cycle among the nodes \['b', 'c'\]"):
+        await NaiveSolver(graph, SearchSpace(), None, "ctx").solve()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @Desc   :
+import json
+from collections import Counter
+
+import pytest
+
+from metagpt.provider.base_llm import BaseLLM
+from metagpt.strategy.base import ThoughtNode
+from metagpt.strategy.tot import BFSSolver, DFSSolver, MCTSSolver
+from metagpt.strategy.tot_schema import BaseEvaluator, BaseParser, ThoughtSolverConfig
+from tests.mock.mock_concurrency import ConcurrencyProbe
+
+
+class PathParser(BaseParser):
+    """The state of a node is the path of choices made so far, e.g. `ab`."""
+
+    def __call__(self, input_text: str) -> str:
+        return input_text
+
+    def propose(self, current_state: str, **kwargs) -> str:
+        return f"propose: {current_state}"
+
+    def value(self, input: str = "", **kwargs) -> str:
+        return f"value: {input}"
+
+
+class PathEvaluator(BaseEvaluator):
+    def __call__(self, evaluation: str, **kwargs) -> float:
+        return float(evaluation)
+
+    def status_verify(self, value):
+        return True  # keep every branch open for the search
+
+
+class ScriptedLLM:
+    """Proposes the choices `a` and `b` for every state, the more a state agrees with the target the better."""
+
+    def __init__(self, target: str):
+        self.target = target
+        self.proposed = Counter()
+        self.evaluated = Counter()
+        self.proposing = ConcurrencyProbe()
+
+    async def aask(self, msg: str, **kwargs) -> str:
+        kind, state = msg.split("\n")[0].split(": ")
+        if kind == "propose":
+            self.proposed[state] += 1
+            await self.proposing.run()
+            thoughts = [{"node_id": str(i), "node_state_instruction": state + c} for i, c in enumerate("ab")]
+            return f"```json\n{json.dumps(thoughts)}\n```"
+        self.evaluated[state] += 1
+        return "1" if self.target.startswith(state) else "0"
+
+
+@pytest.mark.asyncio
+async def test_mcts_solver(mocker):
+    llm = ScriptedLLM(target="bab")
+    mocker.patch.object(BaseLLM, "aask", lambda self, *args, **kwargs: llm.aask(*args, **kwargs))
+    config = ThoughtSolverConfig(
+        max_steps=3, n_simulations=12, n_parallel_rollouts=4, parser=PathParser(), evaluator=PathEvaluator()
+    )
+
+    solution = await MCTSSolver(config=config).solve(init_prompt="")
+
+    assert solution == ["", "b", "ba", "bab"]
+    assert llm.proposing.peak > 1  # rollouts expanded nodes at the same time
+    assert max(llm.proposed.values()) == 1  # but never the same node twice
+
+
+@pytest.mark.asyncio
+async def test_bfs_solver_eval_cache(mocker):
+    llm = ScriptedLLM(target="bab")
+    mocker.patch.object(BaseLLM, "aask", lambda self, *args, **kwargs: llm.aask(*args, **kwargs))
+    config = ThoughtSolverConfig(
+        max_steps=2,
+        parser=PathParser(),
+        evaluator=PathEvaluator(),
+        canonicalizer=lambda state: "".join(sorted(state)),  # the order of the choices does not matter
+    )
+    solver = BFSSolver(config=config)
+
+    await solver.solve(init_prompt="")
+
+    # a, b, then aa, ab, ba, bb where ba is the same state as ab
+    assert sum(llm.evaluated.values()) == 5
+    assert llm.evaluated["ab"] + llm.evaluated["ba"] == 1
+    assert solver.eval_cache_hit_rate == 1 / 6
+
+
+@pytest.mark.asyncio
+async def test_dfs_solver_eval_cache(mocker):
+    llm = ScriptedLLM(target="aa")
+    mocker.patch.object(BaseLLM, "aask", lambda self, *args, **kwargs: llm.aask(*args, **kwargs))
+    config = ThoughtSolverConfig(max_steps=2, n_solution_sample=2, parser=PathParser(), evaluator=PathEvaluator())
+    solver = DFSSolver(config=config)
+
+    await solver.solve(init_prompt="")
+
+    # both samples walk down a, aa; without a canonicalizer the evaluation prompt is the key
+    assert llm.evaluated == {"a": 1, "aa": 1}
+    assert solver.eval_cache_hit_rate == 1 / 2
+
+
+@pytest.mark.asyncio
+async def test_eval_cache_drops_failed_evaluation(mocker):
+    aask = mocker.patch.object(BaseLLM, "aask", side_effect=[RuntimeError("timeout"), "1", "0"])
+    solver = BFSSolver(
+        config=ThoughtSolverConfig(
+            parser=PathParser(), evaluator=PathEvaluator(), canonicalizer=lambda state: state.strip()
+        )
+    )
+
+    with pytest.raises(RuntimeError):
+        await solver.evaluate_node(ThoughtNode("a"), parent_value=0)
+    node = ThoughtNode("a")
+    await solver.evaluate_node(node, parent_value=0)
+    await solver.evaluate_node(ThoughtNode(" a "), parent_value=0)  # the same state once canonicalized
+
+    assert node.value == 1
+    assert aask.call_count == 2
+    assert solver.eval_cache_hit_rate == 1 / 3
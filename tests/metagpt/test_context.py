@@ -7,6 +7,8 @@
 """
 from metagpt.configs.llm_config import LLMType
 from metagpt.context import AttrDict, Context
+from metagpt.utils.cost_manager import TokenCostManager
+from metagpt.utils.git_repository import GitRepository
 
 
 def test_attr_dict_1():
@@ -71,3 +73,45 @@ def test_context_3():
     # assert ctx.llm() is not None
     # assert "gpt" in ctx.llm().model
     pass
+
+
+def test_context_project_repo(tmp_path):
+    ctx = Context(git_repo=GitRepository(local_path=tmp_path / "a", auto_init=True))
+    repo = ctx.project_repo()
+    assert repo.workdir == tmp_path / "a"
+    assert ctx.project_repo() is repo
+
+    ctx.git_repo = GitRepository(local_path=tmp_path / "b", auto_init=True)
+    new_repo = ctx.project_repo()
+    assert new_repo is not repo
+    assert new_repo.workdir == tmp_path / "b"
+
+
+def test_context_llm_shares_client():
+    ctx = Context()
+    llm = ctx.llm()
+    llm.system_prompt = "You are a tester."
+    other = Context().llm_with_cost_manager_from_llm_config(ctx.config.llm)
+    assert other is not llm
+    assert other.aclient is llm.aclient
+    assert other.system_prompt != llm.system_prompt
+    assert llm.cost_manager is ctx.cost_manager
+
+    config = ctx.config.llm.model_copy(update={"api_type": LLMType.OPEN_LLM, "base_url": "http://127.0.0.1:1/v1"})
+    assert ctx.llm_with_cost_manager_from_llm_config(config).aclient is not llm.aclient
+    assert ctx.llm_with_cost_manager_from_llm_config(config).cost_manager is (
+        ctx.llm_with_cost_manager_from_llm_config(config).cost_manager
+    )
+
+
+def test_context_llm_cost_manager_per_context():
+    config = Context().config.llm.model_copy(update={"api_type": LLMType.OLLAMA, "base_url": "http://127.0.0.1:1"})
+    ctx, other_ctx = Context(), Context()
+    llm = ctx.llm_with_cost_manager_from_llm_config(config)
+    other = other_ctx.llm_with_cost_manager_from_llm_config(config)
+    assert isinstance(llm.cost_manager, TokenCostManager)
+    assert llm.cost_manager is not other.cost_manager
+    assert llm.cost_manager is ctx.llm_with_cost_manager_from_llm_config(config).cost_manager
+
+    llm.cost_manager.update_cost(10, 20, config.model)
+    assert other.cost_manager.total_prompt_tokens == 0
@@ -57,7 +57,45 @@ async def test_publish_and_process_message(env: Environment):
     env.publish_message(Message(role="User", content="需要一个基于LLM做总结的搜索引擎", cause_by=UserRequirement))
     await env.run(k=2)
     logger.info(f"{env.history=}")
-    assert len(env.history) > 10
+    assert len(str(env.history)) > 10
+
+
+@pytest.mark.asyncio
+async def test_run_schedules_ready_roles_only(env: Environment, mocker):
+    alice = Role(name="Alice", profile="product manager")
+    bob = Role(name="Bob", profile="engineer")
+    env.add_roles([alice, bob])
+    alice.set_addresses({"alice"})
+    assert env.is_idle
+
+    observe = mocker.spy(Role, "_observe")
+    env.publish_message(Message(content="test", cause_by="test", send_to="alice"))
+    assert env.ready_roles == {alice}
+    assert not env.is_idle
+
+    await env.run()
+    assert observe.call_count == 1
+    assert env.is_idle
+
+    await env.run(k=3)
+    assert observe.call_count == 1
+
+
+def test_publish_message_routes_by_address(env: Environment, mocker):
+    roles = [Role(name=f"Role{i}", profile=f"profile{i}") for i in range(120)]
+    env.add_roles(roles)
+    put_message = mocker.spy(Role, "put_message")
+
+    env.publish_message(Message(content="test", cause_by="test", send_to="Role7"))
+    assert [call.args[0] for call in put_message.call_args_list] == [roles[7]]
+
+    roles[7].set_addresses({"renamed"})
+    env.publish_message(Message(content="test", cause_by="test", send_to={"Role7", "Role8", "renamed"}))
+    assert {call.args[0] for call in put_message.call_args_list[1:]} == {roles[7], roles[8]}
+    assert put_message.call_count == 3
+
+    env.publish_message(Message(content="test", cause_by="test"))
+    assert put_message.call_count == 3 + len(roles)
 
 
 if __name__ == "__main__":
@@ -154,5 +154,33 @@ async def test_think_act():
     assert rsp.content == "run"
 
 
+def test_render_history(mocker):
+    role = Role()
+    spy = mocker.spy(Message, "__str__")
+    for i in range(3):
+        role.rc.memory.add(Message(content=str(i)))
+    assert role.rc.render_history() == str(role.rc.history)
+    spy.reset_mock()
+
+    role.rc.memory.add(Message(content="3"))
+    rendered = role.rc.render_history()
+    assert spy.call_count == 1  # only the new message is formatted
+    assert rendered == str(role.rc.history)
+
+    role.rc.history_window = 2
+    assert role.rc.render_history() == "[user: 2, user: 3]"
+
+    role.rc.memory.delete_newest()
+    role.rc.memory.add(Message(content="4"))
+    assert role.rc.render_history() == "[user: 2, user: 4]"
+
+
+def test_render_history_window_default():
+    role = Role()
+    for i in range(role.rc.history_window + 1):
+        role.rc.memory.add(Message(content=str(i)))
+    assert role.rc.render_history() == str(role.rc.history[1:])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-s"])
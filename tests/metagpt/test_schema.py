@@ -15,12 +15,17 @@ import pytest
 from metagpt.actions import Action
 from metagpt.actions.action_node import ActionNode
 from metagpt.actions.write_code import WriteCode
-from metagpt.const import SYSTEM_DESIGN_FILE_REPO, TASK_FILE_REPO
+from metagpt.const import (
+    MESSAGE_ROUTE_TO_ALL,
+    SYSTEM_DESIGN_FILE_REPO,
+    TASK_FILE_REPO,
+)
 from metagpt.schema import (
     AIMessage,
     CodeSummarizeContext,
     Document,
     Message,
+    MessageHistory,
     MessageQueue,
     Plan,
     SystemMessage,
@@ -134,12 +139,56 @@ async def test_message_queue():
     msg = mq.pop()
     assert msg.content == "1"
 
+    mq.push(Message(content="3"))
+
     val = await mq.dump()
-    assert val
+    assert [Message.load(i).content for i in json.loads(val)] == ["2中文测试aaa", "3"]
     new_mq = MessageQueue.load(val)
     assert new_mq.pop_all() == mq.pop_all()
 
 
+def test_message_history(tmp_path):
+    spill_path = tmp_path / "history.jsonl"
+    history = MessageHistory(max_size=2, spill_path=spill_path)
+    for i in range(3):
+        history.add(Message(content=str(i)))
+    assert len(history) == 2
+    assert [m.content for m in history.get()] == ["1", "2"]
+    assert str(history) == "\nuser: 1\nuser: 2"
+    assert [json.loads(line)["content"] for line in spill_path.read_text().splitlines()] == ["0", "1", "2"]
+
+    history.close()
+    history.add(Message(content="3"))
+    history.close()
+    assert spill_path.read_text().count("\n") == 4
+
+    new_history = MessageHistory(**history.model_dump())
+    assert new_history.storage.maxlen == 2
+    assert new_history.get() == history.get()
+
+
+def test_message_history_from_rendered_text():
+    text = "\nuser: hi\nAlice(Engineer): line 1\nline 2"
+    history = MessageHistory.model_validate(text)
+    assert [(m.role, m.content) for m in history.get()] == [("user", "hi"), ("Alice(Engineer)", "line 1\nline 2")]
+    assert history.render() == text
+    assert not MessageHistory.model_validate("").get()
+
+
+def test_message_fast():
+    ic_obj = ActionNode.create_model_class("code", {"Code": (str, ...)})
+    kwargs = dict(content="code", instruct_content=ic_obj(Code="pass"), role="Engineer", sent_from="Alice")
+    m = Message.fast(cause_by=any_to_str(WriteCode), send_to={"Bob"}, **kwargs)
+    want = Message(cause_by=WriteCode, send_to="Bob", **kwargs)
+    assert m.model_dump(exclude={"id"}) == want.model_dump(exclude={"id"})
+    assert m.id and m.id != want.id
+    assert Message(**m.model_dump()) == m
+
+    m = Message.fast("hello")
+    assert m.cause_by == Message(content="hello").cause_by
+    assert m.send_to == {MESSAGE_ROUTE_TO_ALL}
+
+
 @pytest.mark.parametrize(
     ("file_list", "want"),
     [
@@ -349,6 +398,24 @@ class TestPlan:
         plan._update_current_task()
         assert plan.current_task_id == "2"
 
+    def test_get_ready_tasks(self):
+        tasks = [
+            Task(task_id="1"),
+            Task(task_id="2", dependent_task_ids=["1"]),
+            Task(task_id="3", dependent_task_ids=["1"]),
+            Task(task_id="4", dependent_task_ids=["2", "3"]),
+        ]
+        plan = Plan(goal="Test")
+        plan.add_tasks(tasks)
+        assert [task.task_id for task in plan.get_ready_tasks()] == ["1"]
+        plan.finish_task("1")
+        assert [task.task_id for task in plan.get_ready_tasks()] == ["2", "3"]
+        plan.finish_task("3")
+        assert [task.task_id for task in plan.get_ready_tasks()] == ["2"]
+        assert plan.current_task_id == "2"
+        assert [task.task_id for task in plan.get_dependency_tasks("4")] == ["1", "2", "3"]
+        assert plan.get_dependency_tasks("1") == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-s"])
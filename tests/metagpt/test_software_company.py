@@ -9,7 +9,7 @@ import pytest
 from typer.testing import CliRunner
 
 from metagpt.logs import logger
-from metagpt.software_company import app
+from metagpt.software_company import app, run_companies
 from metagpt.team import Team
 
 runner = CliRunner()
@@ -30,5 +30,23 @@ def test_software_company(new_filename):
     logger.info(result.output)
 
 
+@pytest.mark.asyncio
+async def test_run_companies(mocker, tmp_path, concurrency_probe):
+    contexts = []
+
+    async def mock_run(self, n_round=3, **kwargs):
+        contexts.append(self.env.context)
+        await concurrency_probe.run()
+
+    mocker.patch.object(Team, "run", mock_run)
+    await run_companies("Make a cli snake game", n_runs=5, max_concurrency=2, workspace_path=tmp_path)
+
+    assert concurrency_probe.peak == 2
+    assert len({id(ctx) for ctx in contexts}) == 5
+    assert len({id(ctx.config) for ctx in contexts}) == 5
+    assert len({ctx.config.project_name for ctx in contexts}) == 5
+    assert all(ctx.config.workspace.path == tmp_path for ctx in contexts)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-s"])
@@ -3,15 +3,20 @@
 """
 @Desc   : the unittest of serialize
 """
-
+import gc
 from typing import List
 
+from pydantic import create_model
+
 from metagpt.actions import WritePRD
 from metagpt.actions.action_node import ActionNode
 from metagpt.schema import Message
 from metagpt.utils.serialize import (
+    _ic_meta_cache,
     actionoutout_schema_to_mapping,
     deserialize_message,
+    get_instruct_content_class,
+    get_instruct_content_meta,
     serialize_message,
 )
 
@@ -66,3 +71,29 @@ def test_serialize_and_deserialize_message():
     assert new_message.content == message.content
     assert new_message.cause_by == message.cause_by
     assert new_message.instruct_content.field1 == out_data["field1"]
+
+
+def test_instruct_content_cache(mocker):
+    ic_cls = ActionNode.create_model_class("cache_test", {"field1": (str, ...), "field2": (List[str], ...)})
+    meta = get_instruct_content_meta(ic_cls)
+    assert meta == {"class": "cache_test", "mapping": {"field1": str((str, ...)), "field2": str((list[str], ...))}}
+
+    schema = mocker.spy(ic_cls, "model_json_schema")
+    message = Message(content="cache", instruct_content=ic_cls(field1="a", field2=["b"]))
+    ser_data = message.model_dump()
+    assert ser_data["instruct_content"]["value"] == {"field1": "a", "field2": ["b"]}
+    assert schema.call_count == 0
+
+    assert get_instruct_content_class("cache_test", meta["mapping"]) is ic_cls
+    new_message = Message(**ser_data)
+    assert type(new_message.instruct_content) is ic_cls
+
+
+def test_instruct_content_meta_cache_is_weak():
+    ic_cls = create_model("weak_cache_test", field1=(str, ...))
+    assert get_instruct_content_meta(ic_cls) == {"class": "weak_cache_test", "module": ic_cls.__module__}
+    assert ic_cls in _ic_meta_cache
+
+    del ic_cls
+    gc.collect()
+    assert not any(cls.__name__ == "weak_cache_test" for cls in _ic_meta_cache.keys())
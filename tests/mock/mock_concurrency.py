@@ -0,0 +1,21 @@
+import asyncio
+
+
+class ConcurrencyProbe:
+    """Stands in for the slow part of a mocked coroutine and records how many coroutines were in it at the same time.
+
+    Usage in a mock: `await probe.run()` where the real work would be, then assert on `probe.peak`.
+    """
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+
+    async def run(self):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)  # let the other ready coroutines enter meanwhile
+        finally:
+            self.running -= 1